@@ -10,11 +10,17 @@ Key integrations:
 - MLflow tracing for observability
 """
 
+import contextvars
 import json
 import os
 import re
+import threading
+import time
 import warnings
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any, Generator, Optional
 from uuid import uuid4
 
@@ -33,11 +39,20 @@ from mlflow.types.responses import (
     to_chat_completions_input,
 )
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
 # Environment variables are injected by Databricks Model Serving from secrets
 LLM_ENDPOINT_NAME = os.environ.get("LLM_ENDPOINT", "databricks-gpt-5-2")
 GLEAN_API_TOKEN = os.environ.get("GLEAN_API_TOKEN")
 GLEAN_INSTANCE = os.environ.get("GLEAN_INSTANCE")
 
+# Glean responses and tool-call arguments are parsed on every step of the
+# loop; use orjson's C parser when it is installed
+_json_loads = orjson.loads if orjson else json.loads
+
 SYSTEM_PROMPT = """
 <role>
 You are the EPS Account Intelligence Agent, an expert assistant helping Account Managers retrieve and synthesize account intelligence across enterprise systems: Salesforce, Google Drive, Gong, Gmail, and Slack.
@@ -77,6 +92,7 @@ Respond: "I'm the EPS Account Intelligence assistant. I help with account inform
 | Metrics, dashboards, spend | search_metrics_and_dashboards | Trends, YoY changes |
 | QBRs, account plans, strategy | search_strategy_docs | Goals, blockers, action items |
 | Calls, emails, sentiment | search_communications | Tone, key topics, escalations |
+| Status summary, meeting prep, account overview | search_account_360 | All of the above in one call |
 | Jira tickets, issues, requests | search_general_fallback | Status, assignee, priority |
 | Confluence docs, wikis | search_general_fallback | Documentation, processes |
 </tool_routing>
@@ -97,6 +113,7 @@ Query construction: Place account name FIRST — "AdventHealth renewal" (not "re
 <use_cases>
 
 <use_case name="Customer Status Summary">
+Call search_account_360 with the account name FIRST - it runs every domain search at once.
 When asked for account status/overview, include:
 - Overall sentiment (positive/neutral/at-risk based on recent communications)
 - Key dates (renewal, last QBR, upcoming meetings)
@@ -113,6 +130,7 @@ When asked about deal/opportunity progress:
 </use_case>
 
 <use_case name="Meeting Prep">
+Call search_account_360 with the account name FIRST, then follow up with targeted searches if needed.
 When preparing for a customer call:
 - Last conversation summary (from Gong)
 - Open action items (from previous meetings)
@@ -215,6 +233,35 @@ When a tool returns "No accessible results":
 </permission_handling>
 """
 
+# The system message is the stable prefix of every LLM request. Keep it
+# byte-identical (no per-request data) so the serving endpoint's prompt
+# cache can reuse it; conversation history is only ever appended after it.
+SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+
+
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+
+def _get_http_client() -> httpx.Client:
+    """
+    Get the shared Glean HTTP client, creating it on first use.
+    
+    One pooled client keeps connections to Glean alive across tool calls
+    and requests; httpx.Client is safe to share between threads.
+    """
+    global _http_client
+    
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = httpx.Client(
+                    timeout=30.0,
+                    limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+                    headers={"Authorization": f"Bearer {GLEAN_API_TOKEN}"},
+                )
+    return _http_client
+
 
 def _get_glean_api_url() -> str:
     """Construct Glean API URL from instance name."""
@@ -229,25 +276,94 @@ def _get_glean_api_url() -> str:
     return f"https://{clean}/rest/api/v1/search"
 
 
+class TTLCache:
+    """Small thread-safe LRU cache whose entries expire after `ttl` seconds."""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Any) -> Any:
+        """Return the cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            
+            self._data.move_to_end(key)
+            return value
+    
+    def set(self, key: Any, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._data.clear()
+
+
+# Search results keyed on the full request. Every call uses the same
+# GLEAN_API_TOKEN, so results are safe to share across requests; the short
+# TTL keeps permission and data changes from lingering.
+_search_cache = TTLCache(maxsize=1024, ttl=300)
+
+
+def _search_key(
+    query: str,
+    datasources: Optional[list[str]],
+    num_results: int,
+    facet_filters: Optional[list[dict]]
+) -> tuple:
+    """Hashable cache key for a search - facet filters are canonicalised as JSON."""
+    return (
+        query,
+        tuple(datasources) if datasources else (),
+        num_results,
+        json.dumps(facet_filters, sort_keys=True) if facet_filters else "",
+    )
+
+
 def glean_search(
     query: str, 
     datasources: Optional[list[str]] = None, 
     num_results: int = 10,
-    facet_filters: Optional[list[dict]] = None
+    facet_filters: Optional[list[dict]] = None,
+    use_cache: bool = True
 ) -> list[dict]:
     """
     Search Glean via REST API.
     
     Note: Glean silently filters results based on user permissions (OAuth passthrough).
     Empty results may indicate no matches OR no permission to view matches.
+    
+    Successful results are cached for a few minutes; pass use_cache=False
+    to always hit Glean.
     """
     if not GLEAN_API_TOKEN:
         raise RuntimeError("GLEAN_API_TOKEN not set")
     
-    headers = {"Authorization": f"Bearer {GLEAN_API_TOKEN}"}
+    key = _search_key(query, datasources, num_results, facet_filters)
+    if use_cache:
+        cached = _search_cache.get(key)
+        if cached is not None:
+            return cached
     
     request_options = {
         "facetBucketSize": 100,
+        # Tools only read results - skip facets, tabs and counts in the response
+        "responseHints": ["RESULTS"],
         # Note: returnLlmContentOverSnippets requires maxSnippetSize ≤ 10000
         # We use high maxSnippetSize (100k) to get full Gong transcripts instead
     }
@@ -266,28 +382,29 @@ def glean_search(
     }
     
     try:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.post(_get_glean_api_url(), headers=headers, json=payload)
-            response.raise_for_status()
-            
-            data = response.json()
-            results = data.get("results", [])
-            
-            formatted = []
-            for r in results:
-                doc = r.get("document", {})
-                content = r.get("llmContent") or r.get("snippets", [])
-                
-                formatted.append({
-                    "title": doc.get("title", "Untitled"),
-                    "url": doc.get("url", ""),
-                    "content": content,
-                    "datasource": doc.get("datasource", ""),
-                    "author": doc.get("author", {}).get("name", "Unknown"),
-                    "updatedAt": doc.get("updateTime", "")
-                })
-            return formatted
+        response = _get_http_client().post(_get_glean_api_url(), json=payload)
+        response.raise_for_status()
+        
+        data = _json_loads(response.content)
+        results = data.get("results", [])
+        
+        formatted = []
+        for r in results:
+            doc = r.get("document", {})
+            content = r.get("llmContent") or r.get("snippets", [])
             
+            formatted.append({
+                "title": doc.get("title", "Untitled"),
+                "url": doc.get("url", ""),
+                "content": content,
+                "datasource": doc.get("datasource", ""),
+                "author": doc.get("author", {}).get("name", "Unknown"),
+                "updatedAt": doc.get("updateTime", "")
+            })
+        
+        _search_cache.set(key, formatted)
+        return formatted
+        
     except httpx.HTTPStatusError as e:
         # Glean uses non-standard error codes - see support.glean.com/hc/en-us/articles/30458821065883
         if e.response.status_code == 400:
@@ -370,6 +487,32 @@ def format_results(results: list[dict], source_name: str, query: str = "") -> st
     return header + "\n".join(formatted)
 
 
+# Words that mark the end of the account name in a query ("AdventHealth renewal")
+_ACTION_WORDS = frozenset({
+    'renewal', 'renew', 'contract', 'opportunity', 'deal',
+    'contact', 'contacts', 'stakeholder', 'decision',
+    'account', 'company', 'info', 'overview',
+    'call', 'calls', 'meeting', 'email', 'slack',
+    'qbr', 'ebr', 'plan', 'strategy', 'doc',
+    'metric', 'metrics', 'dashboard', 'spend', 'funding',
+    'key', 'recent', 'last', 'latest', 'upcoming',
+})
+
+# Whole whitespace-delimited action word candidates, in one regex scan.
+# Unicode IGNORECASE also matches e.g. 'ſlack', so candidates are confirmed
+# with str.lower() - see _first_action_word
+_ACTION_RE = re.compile(
+    r'(?<!\S)(?:' + '|'.join(map(re.escape, sorted(_ACTION_WORDS, key=len, reverse=True))) + r')(?!\S)',
+    re.IGNORECASE
+)
+
+
+def _first_action_word(query: str) -> Optional[re.Match]:
+    """First word of `query` whose lower() is an action word, or None."""
+    return next((m for m in _ACTION_RE.finditer(query) if m.group().lower() in _ACTION_WORDS), None)
+
+
+@lru_cache(maxsize=1024)  # pure; the same account queries repeat a lot
 def quote_account_name(query: str) -> str:
     """
     Quote account name to improve search precision.
@@ -377,37 +520,19 @@ def quote_account_name(query: str) -> str:
     Without quoting, "JPMorgan Chase renewal" may return results for other companies.
     Quoting ensures Glean treats multi-word names as a single entity.
     """
-    if query.startswith('"'):
+    if query.lstrip().startswith('"'):
         return query
     
-    action_words = [
-        'renewal', 'renew', 'contract', 'opportunity', 'deal',
-        'contact', 'contacts', 'stakeholder', 'decision',
-        'account', 'company', 'info', 'overview',
-        'call', 'calls', 'meeting', 'email', 'slack',
-        'qbr', 'ebr', 'plan', 'strategy', 'doc',
-        'metric', 'metrics', 'dashboard', 'spend', 'funding',
-        'key', 'recent', 'last', 'latest', 'upcoming'
-    ]
+    # Everything before the first action word is the account name
+    match = _first_action_word(query)
+    split = match.start() if match else len(query)
     
-    words = query.split()
-    account_words = []
-    rest_words = []
-    found_action = False
-    
-    for word in words:
-        if not found_action and word.lower() not in action_words:
-            account_words.append(word)
-        else:
-            found_action = True
-            rest_words.append(word)
-    
-    if account_words:
-        account_name = ' '.join(account_words)
-        rest = ' '.join(rest_words)
-        return f'"{account_name}" {rest}'.strip()
+    account_name = ' '.join(query[:split].split())
+    if not account_name:
+        return query
     
-    return query
+    rest = ' '.join(query[split:].split())
+    return f'"{account_name}" {rest}'.strip()
 
 
 # EP account aliases - source: Guild EP Acronym list
@@ -573,15 +698,24 @@ def merge_facet_filters(existing: Optional[list[dict]], new: Optional[list[dict]
     return existing + new
 
 
+def _type_filter(doc_type: str) -> list[dict]:
+    """Build a facet filter restricting results to one document type."""
+    return [{"fieldName": "type", "values": [{"value": doc_type, "relationType": "EQUALS"}]}]
+
+
+# Fixed per-tool filters, built once at import and shared by every call.
+# merge_facet_filters returns a new list, so these are never mutated.
+_OPPORTUNITY_FILTER = _type_filter("opportunity")
+_ACCOUNT_FILTER = _type_filter("account")
+_CONTACT_FILTER = _type_filter("contact")
+
+
 @mlflow.trace(span_type=SpanType.TOOL)
 def search_salesforce_opportunities(query: str) -> str:
     """Search Salesforce for opportunities (renewals, contracts, deals). Supports time filters."""
     cleaned_query, date_filter = parse_time_expression(query)
     optimized_query = quote_account_name(cleaned_query)
-    type_filter = [
-        {"fieldName": "type", "values": [{"value": "opportunity", "relationType": "EQUALS"}]}
-    ]
-    facet_filters = merge_facet_filters(type_filter, date_filter)
+    facet_filters = merge_facet_filters(_OPPORTUNITY_FILTER, date_filter)
     results = glean_search(optimized_query, datasources=["salescloud"], num_results=5, facet_filters=facet_filters)
     return format_results(results, "Salesforce Opportunities")
 
@@ -590,10 +724,7 @@ def search_salesforce_opportunities(query: str) -> str:
 def search_salesforce_accounts(query: str) -> str:
     """Search Salesforce for account records (company info)."""
     optimized_query = quote_account_name(query)
-    facet_filters = [
-        {"fieldName": "type", "values": [{"value": "account", "relationType": "EQUALS"}]}
-    ]
-    results = glean_search(optimized_query, datasources=["salescloud"], num_results=5, facet_filters=facet_filters)
+    results = glean_search(optimized_query, datasources=["salescloud"], num_results=5, facet_filters=_ACCOUNT_FILTER)
     return format_results(results, "Salesforce Accounts")
 
 
@@ -601,10 +732,7 @@ def search_salesforce_accounts(query: str) -> str:
 def search_salesforce_contacts(query: str) -> str:
     """Search Salesforce for CLIENT contacts at partner companies (not Guild employees)."""
     optimized_query = quote_account_name(query)
-    facet_filters = [
-        {"fieldName": "type", "values": [{"value": "contact", "relationType": "EQUALS"}]}
-    ]
-    results = glean_search(optimized_query, datasources=["salescloud"], num_results=5, facet_filters=facet_filters)
+    results = glean_search(optimized_query, datasources=["salescloud"], num_results=5, facet_filters=_CONTACT_FILTER)
     return format_results(results, "Salesforce Contacts")
 
 
@@ -638,10 +766,34 @@ def search_communications(query: str) -> str:
 def search_general_fallback(query: str) -> str:
     """Search ALL sources. Use only when user approves."""
     optimized_query = quote_account_name(query)
-    results = glean_search(optimized_query, datasources=None, num_results=10)
+    results = glean_search(optimized_query, datasources=None, num_results=10, use_cache=False)
     return format_results(results, "All Sources")
 
 
+# Domain searches combined by search_account_360, in output order
+ACCOUNT_360_TOOLS = (
+    search_salesforce_opportunities,
+    search_salesforce_accounts,
+    search_salesforce_contacts,
+    search_metrics_and_dashboards,
+    search_strategy_docs,
+    search_communications,
+)
+
+_account_360_pool = ThreadPoolExecutor(max_workers=len(ACCOUNT_360_TOOLS))
+
+
+@mlflow.trace(span_type=SpanType.TOOL)
+def search_account_360(account: str) -> str:
+    """Run every domain search for an account in parallel. For status summaries and meeting prep."""
+    # Each search runs in a copy of this context so its span nests under this one
+    futures = [
+        _account_360_pool.submit(contextvars.copy_context().run, tool, account)
+        for tool in ACCOUNT_360_TOOLS
+    ]
+    return "\n\n---\n\n".join(future.result() for future in futures)
+
+
 TOOLS = {
     "search_salesforce_opportunities": search_salesforce_opportunities,
     "search_salesforce_accounts": search_salesforce_accounts,
@@ -650,6 +802,7 @@ TOOLS = {
     "search_strategy_docs": search_strategy_docs,
     "search_communications": search_communications,
     "search_general_fallback": search_general_fallback,
+    "search_account_360": search_account_360,
 }
 
 TOOL_SPECS = [
@@ -737,6 +890,18 @@ TOOL_SPECS = [
             }
         }
     },
+    {
+        "type": "function",
+        "function": {
+            "name": "search_account_360",
+            "description": "Use this when the user asks for a status summary, meeting prep, or account overview. Runs the opportunity, account, contact, metrics, strategy and communications searches in one call.",
+            "parameters": {
+                "type": "object",
+                "properties": {"account": {"type": "string", "description": "Account name only (e.g., 'AdventHealth')"}},
+                "required": ["account"]
+            }
+        }
+    },
 ]
 
 
@@ -805,7 +970,7 @@ class EPSAccountAgent(ResponsesAgent):
         self, tool_call: dict, messages: list[dict]
     ) -> ResponsesAgentStreamEvent:
         """Execute a tool call and append result to message history."""
-        args = json.loads(tool_call["arguments"])
+        args = _json_loads(tool_call["arguments"])
         result = self.execute_tool(tool_call["name"], args)
         
         tool_output = self.create_function_call_output_item(
@@ -868,7 +1033,7 @@ class EPSAccountAgent(ResponsesAgent):
                     }
                 )
             
-            messages = [{"role": "system", "content": SYSTEM_PROMPT}]
+            messages = [dict(SYSTEM_MESSAGE)]
             messages.extend([msg.model_dump() for msg in request.input])
             yield from self._call_and_run_tools(messages)
         except Exception:
@@ -5,28 +5,57 @@ A standalone CLI for testing the Responses API agent locally.
 Uses OpenAI directly (no Databricks required).
 
 Usage:
-    python eps_agent_cli.py
+    python eps_agent_cli.py [--no-cache]
 
 Prerequisites:
     - GLEAN_API_TOKEN: Your Glean API token
     - GLEAN_INSTANCE: Your Glean instance (e.g., guild-be.glean.com)
     - OPENAI_API_KEY: Your OpenAI API key
+
+Optional:
+    - EPS_WARM_ACCOUNTS: Comma-separated accounts to pre-load into the cache
 """
 
+import argparse
+import asyncio
+import contextlib
+import contextvars
+import hashlib
 import json
 import os
+import re
+import sqlite3
 import sys
-from typing import Any, Callable, Generator, Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Generator, Literal, Optional
 from uuid import uuid4
 
 import httpx
 from dotenv import load_dotenv
-from openai import OpenAI
-from rich.console import Console
+from openai import AsyncOpenAI
+from rich.console import Console, Group
 from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.spinner import Spinner
 from rich.live import Live
+from rich.text import Text
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+try:
+    import h2  # lets httpx multiplex concurrent requests over one HTTP/2 connection
+except ImportError:  # optional speedup
+    h2 = None
+
+try:
+    import uvloop  # faster event loop for socket-heavy I/O
+except ImportError:  # optional speedup
+    uvloop = None
 
 # Load environment variables
 load_dotenv()
@@ -40,10 +69,51 @@ console = Console()
 
 LLM_MODEL = "gpt-5.1"  # or "gpt-4o" for better quality
 
+# Routes every request to the same OpenAI prompt cache shard; the system
+# prompt and tool specs are an identical prefix on every call. Bump the
+# version when either changes.
+PROMPT_CACHE_KEY = "eps-agent-cli-v1"
+
+# Conversation chain limits. Every request re-prefills the whole chain behind
+# previous_response_id, old tool outputs included. Once a chain has run
+# HISTORY_CHAIN_TURNS turns or carried HISTORY_CHAR_BUDGET chars (~4 chars
+# per token, so roughly 32k tokens), the next turn starts a new chain seeded
+# with a recap of the last HISTORY_RECAP_TURNS turns.
+HISTORY_CHAIN_TURNS = 3
+HISTORY_CHAR_BUDGET = 128_000
+HISTORY_RECAP_TURNS = 8
+
+# Commands that end the session
+_EXIT_COMMANDS = frozenset({"quit", "exit", "q"})
+
 # Global Glean credentials (loaded from environment at import time)
 _glean_api_token: Optional[str] = os.environ.get("GLEAN_API_TOKEN")
 _glean_instance: Optional[str] = os.environ.get("GLEAN_INSTANCE")
 
+# Search endpoint, resolved from _glean_instance on first use
+_glean_api_url: Optional[str] = None
+
+# Glean responses and tool-call arguments are parsed on every step of the
+# loop; use orjson's C parser when it is installed
+_json_loads: Callable[[str | bytes], Any] = orjson.loads if orjson else json.loads
+
+# Shared Glean HTTP client - created on first use so it picks up the
+# credentials resolved in main(), then reused for connection keep-alive
+_http_client: Optional[httpx.AsyncClient] = None
+
+# Glean searches currently in flight, keyed by request - identical
+# concurrent searches share one HTTP request instead of each sending one
+_inflight_searches: dict[tuple, asyncio.Task] = {}
+
+# Upper bound on concurrent Glean requests (parallel tool calls plus
+# background cache warming) to stay within Glean's rate limits
+GLEAN_MAX_CONCURRENCY = 8
+_glean_semaphore = asyncio.Semaphore(GLEAN_MAX_CONCURRENCY)
+
+# Set inside background work (cache warming) so its searches don't print
+# over the user's prompt
+_quiet_searches: contextvars.ContextVar[bool] = contextvars.ContextVar("quiet_searches", default=False)
+
 
 # =============================================================================
 # SYSTEM PROMPT (PRD-aligned)
@@ -100,6 +170,7 @@ After ALL tools return, provide a unified response with:
 | Metrics, dashboards, spend | search_metrics_and_dashboards | Looker data |
 | QBRs, account plans, strategy | search_strategy_docs | Google Drive |
 | Calls, emails, sentiment | search_communications | Gong, Slack, Gmail |
+| Status summary, meeting prep, overview | search_account_360 | All six searches in one call |
 
 ## QUERY CONSTRUCTION
 
@@ -132,21 +203,52 @@ Never hallucinate or invent information.
 # GLEAN API
 # =============================================================================
 
-def _get_glean_api_url() -> str:
-    """Get the Glean API URL."""
-    if not _glean_instance:
-        raise RuntimeError("GLEAN_INSTANCE not set")
-    
-    clean = _glean_instance.replace("https://", "").replace("http://", "").rstrip("/")
+def _glean_host(instance: str) -> str:
+    """Resolve a Glean instance setting to its backend host name."""
+    clean = instance.replace("https://", "").replace("http://", "").rstrip("/")
     
     # Handle short form: "guild" → "guild-be.glean.com"
     if "." not in clean:
         clean = f"{clean}-be.glean.com"
     
-    return f"https://{clean}/rest/api/v1/search"
+    return clean
+
+
+def _get_glean_api_url() -> str:
+    """Get the Glean API URL (resolved once, then reused)."""
+    global _glean_api_url
+    
+    if _glean_api_url is None:
+        if not _glean_instance:
+            raise RuntimeError("GLEAN_INSTANCE not set")
+        _glean_api_url = f"https://{_glean_host(_glean_instance)}/rest/api/v1/search"
+    return _glean_api_url
+
 
+def _get_http_client() -> httpx.AsyncClient:
+    """Get the shared Glean HTTP client, creating it on first use."""
+    global _http_client
+    
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            timeout=30.0,
+            http2=h2 is not None,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            headers={"Authorization": f"Bearer {_glean_api_token}"},
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared Glean HTTP client."""
+    global _http_client
+    
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
 
-def discover_datasource_facets(datasource: str) -> dict:
+
+async def discover_datasource_facets(datasource: str) -> dict:
     """
     Discover available facets for a specific datasource.
     
@@ -162,8 +264,6 @@ def discover_datasource_facets(datasource: str) -> dict:
     if not _glean_api_token:
         raise RuntimeError("Glean API token not set")
     
-    headers = {"Authorization": f"Bearer {_glean_api_token}"}
-    
     # Use pageSize=0 and responseHints=["FACET_RESULTS"] for efficiency
     payload = {
         "query": "test",
@@ -181,32 +281,133 @@ def discover_datasource_facets(datasource: str) -> dict:
     }
     
     try:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.post(_get_glean_api_url(), headers=headers, json=payload)
-            response.raise_for_status()
-            
-            data = response.json()
-            facet_results = data.get("facetResults", [])
-            
-            # Extract facet names and sample values
-            facets = {}
-            for facet in facet_results:
-                source_name = facet.get("sourceName", "unknown")
-                buckets = facet.get("buckets", [])
-                values = [b.get("value", {}).get("stringValue", "") for b in buckets[:10]]
-                facets[source_name] = values
-            
-            return facets
-            
+        async with _glean_semaphore:
+            response = await _get_http_client().post(_get_glean_api_url(), json=payload)
+        response.raise_for_status()
+        
+        data = _json_loads(response.content)
+        facet_results = data.get("facetResults", [])
+        
+        # Extract facet names and sample values
+        facets = {}
+        for facet in facet_results:
+            source_name = facet.get("sourceName", "unknown")
+            buckets = facet.get("buckets", [])
+            values = [b.get("value", {}).get("stringValue", "") for b in buckets[:10]]
+            facets[source_name] = values
+        
+        return facets
+        
     except Exception as e:
         return {"error": str(e)}
 
 
-def glean_search(
+# Options sent with every search; per-call filters are layered on top
+_BASE_REQUEST_OPTIONS = {
+    "facetBucketSize": 100,
+    # Tools only read results - skip facets, tabs and counts in the response
+    "responseHints": ["RESULTS"],
+}
+
+# How much document content to pull back per result:
+#   meta    - titles, URLs, dates only
+#   snippet - short snippets (format_results shows 500 chars of them)
+#   full    - Glean's LLM-oriented full content
+ContentLevel = Literal["meta", "snippet", "full"]
+_CONTENT_LEVELS: dict[str, tuple[int, bool]] = {
+    # level: (maxSnippetSize, returnLlmContentOverSnippets)
+    "meta": (0, False),
+    "snippet": (800, False),
+    "full": (4000, True),
+}
+
+
+def _search_log(message: str) -> None:
+    """Print a search progress line unless running in the background."""
+    if not _quiet_searches.get():
+        console.print(message)
+
+
+def _normalize_query(query: str) -> str:
+    """Normalize a query for cache lookups (case and whitespace)."""
+    return " ".join(query.split()).lower()
+
+
+def _search_key(
+    query: str,
+    datasources: Optional[list[str]],
+    num_results: int,
+    facet_filters: Optional[list[dict]],
+    content_level: str = "snippet"
+) -> tuple:
+    """Build a hashable key identifying a Glean search request."""
+    return (
+        _normalize_query(query),
+        tuple(sorted(datasources or ())),
+        num_results,
+        json.dumps(facet_filters, sort_keys=True),
+        content_level,
+    )
+
+
+async def glean_search(
     query: str, 
     datasources: Optional[list[str]] = None, 
     num_results: int = 10,
-    facet_filters: Optional[list[dict]] = None
+    facet_filters: Optional[list[dict]] = None,
+    content_level: ContentLevel = "snippet",
+    use_cache: bool = True
+) -> list[dict]:
+    """
+    Search Glean, serving repeats from the result cache and sharing one
+    request between identical concurrent searches.
+    
+    Takes the same arguments as _glean_search, plus `use_cache` to skip the
+    memory and disk caches for searches whose results shouldn't be reused.
+    """
+    key = _search_key(query, datasources, num_results, facet_filters, content_level)
+    use_cache = use_cache and not _cache_bypass
+    
+    if use_cache:
+        cached = _search_cache.get(key)
+        if cached is not None:
+            _search_log(f"  [dim]   → Query: \"{query}\" (cached)[/dim]")
+            return cached
+        
+        disk_key = _disk_cache_key(key)
+        entry = await _disk_cache.aget_entry(disk_key)
+        if entry is not None:
+            cached, remaining = entry
+            _search_log(f"  [dim]   → Query: \"{query}\" (cached on disk)[/dim]")
+            # Keep it in memory only as long as the disk row has left, so a
+            # result is never served past the disk cache's lifetime
+            _search_cache.set(key, cached, ttl=min(remaining, _search_cache.ttl))
+            return cached
+    
+    task = _inflight_searches.get(key)
+    if task is None:
+        task = asyncio.ensure_future(
+            _glean_search(query, datasources, num_results, facet_filters, content_level)
+        )
+        _inflight_searches[key] = task
+        task.add_done_callback(lambda _: _inflight_searches.pop(key, None))
+    
+    # Shield so one caller being cancelled doesn't cancel the shared request
+    results = await asyncio.shield(task)
+    
+    # Errors are not cached so the next attempt retries Glean
+    if use_cache and not (results and results[0].get("error")):
+        _search_cache.set(key, results)
+        await _disk_cache.aset(disk_key, results)
+    return results
+
+
+async def _glean_search(
+    query: str, 
+    datasources: Optional[list[str]] = None, 
+    num_results: int = 10,
+    facet_filters: Optional[list[dict]] = None,
+    content_level: ContentLevel = "snippet"
 ) -> list[dict]:
     """
     Search Glean via REST API with proper filtering.
@@ -221,76 +422,92 @@ def glean_search(
         num_results: Number of results to return
         facet_filters: List of facet filter objects per Glean API spec
                        Example: [{"fieldName": "type", "values": [{"value": "opportunity", "relationType": "EQUALS"}]}]
+        content_level: "meta", "snippet" or "full" - how much content to fetch
     """
     if not _glean_api_token:
         raise RuntimeError("Glean API token not set")
     
-    headers = {"Authorization": f"Bearer {_glean_api_token}"}
-    
-    console.print(f"  [dim]   → Query: \"{query}\"[/dim]")
+    _search_log(f"  [dim]   → Query: \"{query}\"[/dim]")
     
     # Build requestOptions with proper filtering (per Glean API docs)
-    request_options = {
-        "facetBucketSize": 100,
-        "returnLlmContentOverSnippets": True,
-    }
+    request_options = dict(_BASE_REQUEST_OPTIONS)
+    max_snippet_size, llm_content = _CONTENT_LEVELS[content_level]
+    if llm_content:
+        request_options["returnLlmContentOverSnippets"] = True
     
     # Add datasource filter
     if datasources:
         request_options["datasourcesFilter"] = datasources
-        console.print(f"  [dim]   → Datasources: {datasources}[/dim]")
+        _search_log(f"  [dim]   → Datasources: {datasources}[/dim]")
     
     # Add facet filters (e.g., type:opportunity)
     if facet_filters:
         request_options["facetFilters"] = facet_filters
         filter_desc = ", ".join([f"{f['fieldName']}={f['values'][0]['value']}" for f in facet_filters if f.get('values')])
-        console.print(f"  [dim]   → Type filter: {filter_desc}[/dim]")
+        _search_log(f"  [dim]   → Type filter: {filter_desc}[/dim]")
     
     payload = {
         "query": query,
         "pageSize": num_results,
-        "maxSnippetSize": 4000,
+        "maxSnippetSize": max_snippet_size,
         "requestOptions": request_options
     }
     
     try:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.post(_get_glean_api_url(), headers=headers, json=payload)
-            response.raise_for_status()
-            
-            data = response.json()
-            results = data.get("results", [])
+        async with _glean_semaphore:
+            response = await _get_http_client().post(_get_glean_api_url(), json=payload)
+        response.raise_for_status()
+        
+        data = _json_loads(response.content)
+        results = data.get("results", [])
+        
+        # Debug: show result count
+        _search_log(f"  [dim]   → Glean returned {len(results)} results[/dim]")
+        
+        formatted = []
+        for r in results:
+            doc = r.get("document", {})
             
-            # Debug: show result count
-            console.print(f"  [dim]   → Glean returned {len(results)} results[/dim]")
-            
-            formatted = []
-            for r in results:
-                doc = r.get("document", {})
-                
-                # Prefer llmContent over snippets for richer content
-                # llmContent is provided when returnLlmContentOverSnippets=True
-                content = r.get("llmContent") or r.get("snippets", [])
-                
-                formatted.append({
-                    "title": doc.get("title", "Untitled"),
-                    "url": doc.get("url", ""),
-                    "snippets": content,  # Use llmContent if available
-                    "datasource": doc.get("datasource", ""),
-                    "author": doc.get("author", {}).get("name", "Unknown"),
-                    "updatedAt": doc.get("updateTime", "")
-                })
-            return formatted
+            # Prefer llmContent over snippets for richer content
+            # llmContent is provided when returnLlmContentOverSnippets=True
+            content = r.get("llmContent") or r.get("snippets", [])
             
+            formatted.append({
+                "title": doc.get("title", "Untitled"),
+                "url": doc.get("url", ""),
+                "snippets": content,  # Use llmContent if available
+                "datasource": doc.get("datasource", ""),
+                "author": doc.get("author", {}).get("name", "Unknown"),
+                "updatedAt": doc.get("updateTime", "")
+            })
+        return formatted
+        
     except httpx.HTTPStatusError as e:
-        console.print(f"  [red]   → API Error: {e.response.status_code} - {e.response.text[:200]}[/red]")
+        _search_log(f"  [red]   → API Error: {e.response.status_code} - {e.response.text[:200]}[/red]")
         return [{"error": f"Glean API error: {e.response.status_code}"}]
     except Exception as e:
-        console.print(f"  [red]   → Error: {e}[/red]")
+        _search_log(f"  [red]   → Error: {e}[/red]")
         return [{"error": f"Glean error: {e}"}]
 
 
-def format_results(results: list[dict], source_name: str) -> str:
+def _first_snippet_text(snippets: list) -> str:
+    """Get the text of the first entry in a Glean snippets array."""
+    first = snippets[0] if snippets else None
+    if isinstance(first, dict):
+        return first.get('text', first.get('snippet', ''))
+    if isinstance(first, str):
+        return first
+    return ''
+
+
+# Content is either llmContent (a string) or snippets (an array)
+_CONTENT_TEXT = {
+    str: lambda content: content,
+    list: _first_snippet_text,
+}
+
+
+def format_results(results: list[dict], source_name: str, max_chars: int = 500) -> str:
     """Format search results for LLM with datasource verification."""
     if not results:
         return f"No results found in {source_name}."
@@ -303,46 +520,35 @@ def format_results(results: list[dict], source_name: str) -> str:
     
     formatted = []
     for i, r in enumerate(results[:5], 1):
-        title = r.get('title', 'Untitled')
-        url = r.get('url', '')
-        datasource = r.get('datasource', 'Unknown')
+        get = r.get
+        datasource = get('datasource', 'Unknown')
         datasources_found.add(datasource)
         
-        # Handle both llmContent (string) and snippets (array) formats
-        content = r.get('snippets', [])
-        snippet_text = ''
-        if content:
-            if isinstance(content, str):
-                # llmContent is a string
-                snippet_text = content
-            elif isinstance(content, list):
-                # snippets is an array
-                first = content[0] if content else None
-                if first:
-                    if isinstance(first, dict):
-                        snippet_text = first.get('text', first.get('snippet', ''))
-                    elif isinstance(first, str):
-                        snippet_text = first
+        content = get('snippets')
+        to_text = _CONTENT_TEXT.get(type(content))
+        snippet_text = to_text(content) if to_text else ''
         
-        author = r.get('author', '')
-        updated = r.get('updatedAt', '')[:10] if r.get('updatedAt') else ''
+        author = get('author', '')
+        updated = (get('updatedAt') or '')[:10]
         
         # Emphasize datasource for verification
-        entry = f"**[{i}] {title}**"
-        entry += f"\n- **Datasource: {datasource}**"  # Bold to verify filtering
+        parts = [f"**[{i}] {get('title', 'Untitled')}**", f"\n- **Datasource: {datasource}**"]
         if updated:
-            entry += f" | Updated: {updated}"
+            parts.append(f" | Updated: {updated}")
         if author:
-            entry += f" | Author: {author}"
+            parts.append(f" | Author: {author}")
         if snippet_text:
-            snippet_text = snippet_text[:500] + "..." if len(snippet_text) > 500 else snippet_text
-            entry += f"\n- Content: {snippet_text}"
-        entry += f"\n- URL: {url}"
-        formatted.append(entry)
+            if len(snippet_text) > max_chars:
+                snippet_text = snippet_text[:max_chars] + "..."
+            parts.append(f"\n- Content: {snippet_text}")
+        parts.append(f"\n- URL: {get('url', '')}")
+        formatted.append("".join(parts))
     
     # Add header showing which datasources were returned
-    header = f"Found {len(results)} result(s) from {source_name}\n"
-    header += f"[Datasources in results: {', '.join(sorted(datasources_found))}]\n\n"
+    header = (
+        f"Found {len(results)} result(s) from {source_name}\n"
+        f"[Datasources in results: {', '.join(sorted(datasources_found))}]\n\n"
+    )
     
     return header + "\n\n---\n\n".join(formatted)
 
@@ -362,7 +568,24 @@ def format_results(results: list[dict], source_name: str) -> str:
 # so account name filtering happens via the query string, not filters.
 # The datasourcesFilter restricts to specific apps (salescloud, gong, etc.)
 
-def search_salesforce_opportunities(query: str) -> str:
+def _type_filter(doc_type: str) -> list[dict]:
+    """Build a facet filter restricting results to one document type."""
+    return [{"fieldName": "type", "values": [{"value": doc_type, "relationType": "EQUALS"}]}]
+
+
+# Each tool searches a fixed set of datasources/filters - build them once
+# at import and pass the same objects on every call
+_OPPORTUNITY_FILTER = _type_filter("opportunity")
+_ACCOUNT_FILTER = _type_filter("account")
+_CONTACT_FILTER = _type_filter("contact")
+
+_SALESFORCE = ["salescloud"]
+_METRICS_SOURCES = ["salescloud", "looker"]
+_STRATEGY_SOURCES = ["gdrive"]
+_COMMUNICATION_SOURCES = ["gong", "slack", "gmail"]
+
+
+async def search_salesforce_opportunities(query: str) -> str:
     """
     Search Salesforce for OPPORTUNITIES (renewals, contracts, deals).
     Use this for: renewal dates, contract terms, deal stages, close dates.
@@ -370,15 +593,11 @@ def search_salesforce_opportunities(query: str) -> str:
     The query should include the account/company name prominently.
     Example: "AdventHealth renewal" or "Target contract close date"
     """
-    # Add type filter via facetFilters for opportunities only
-    facet_filters = [
-        {"fieldName": "type", "values": [{"value": "opportunity", "relationType": "EQUALS"}]}
-    ]
-    results = glean_search(query, datasources=["salescloud"], num_results=5, facet_filters=facet_filters)
+    results = await glean_search(query, datasources=_SALESFORCE, num_results=5, facet_filters=_OPPORTUNITY_FILTER)
     return format_results(results, "Salesforce Opportunities")
 
 
-def search_salesforce_accounts(query: str) -> str:
+async def search_salesforce_accounts(query: str) -> str:
     """
     Search Salesforce for ACCOUNT records (company info, account details).
     Use this for: account overview, company information, account health.
@@ -386,15 +605,11 @@ def search_salesforce_accounts(query: str) -> str:
     The query should include the account/company name prominently.
     Example: "AdventHealth account" or "Target company overview"
     """
-    # Add type filter for accounts only
-    facet_filters = [
-        {"fieldName": "type", "values": [{"value": "account", "relationType": "EQUALS"}]}
-    ]
-    results = glean_search(query, datasources=["salescloud"], num_results=5, facet_filters=facet_filters)
+    results = await glean_search(query, datasources=_SALESFORCE, num_results=5, facet_filters=_ACCOUNT_FILTER)
     return format_results(results, "Salesforce Accounts")
 
 
-def search_salesforce_contacts(query: str) -> str:
+async def search_salesforce_contacts(query: str) -> str:
     """
     Search Salesforce for CONTACTS (people, stakeholders, decision makers).
     Use this for: key contacts, decision makers, stakeholders, executives.
@@ -402,15 +617,11 @@ def search_salesforce_contacts(query: str) -> str:
     The query should include the account/company name prominently.
     Example: "AdventHealth contacts" or "Target decision makers"
     """
-    # Add type filter for contacts only
-    facet_filters = [
-        {"fieldName": "type", "values": [{"value": "contact", "relationType": "EQUALS"}]}
-    ]
-    results = glean_search(query, datasources=["salescloud"], num_results=5, facet_filters=facet_filters)
+    results = await glean_search(query, datasources=_SALESFORCE, num_results=5, facet_filters=_CONTACT_FILTER)
     return format_results(results, "Salesforce Contacts")
 
 
-def search_metrics_and_dashboards(query: str) -> str:
+async def search_metrics_and_dashboards(query: str) -> str:
     """
     Search Salesforce and Looker for metrics, dashboards, funding caps, spend.
     Use this for: funding caps, YTD spend, enrollments, utilization dashboards.
@@ -418,11 +629,11 @@ def search_metrics_and_dashboards(query: str) -> str:
     The query should include the account/company name prominently.
     Example: "JPMC annual funding cap" or "AdventHealth enrollment dashboard"
     """
-    results = glean_search(query, datasources=["salescloud", "looker"], num_results=6)
+    results = await glean_search(query, datasources=_METRICS_SOURCES, num_results=6)
     return format_results(results, "Metrics (Salesforce + Looker)")
 
 
-def search_strategy_docs(query: str) -> str:
+async def search_strategy_docs(query: str) -> str:
     """
     Search Google Drive for QBRs, Account Plans, strategy docs, presentations.
     Use this for: account strategy, QBR decks, business reviews, planning docs.
@@ -430,11 +641,12 @@ def search_strategy_docs(query: str) -> str:
     The query should include the account/company name prominently.
     Example: "AdventHealth QBR" or "Target account plan 2025"
     """
-    results = glean_search(query, datasources=["gdrive"], num_results=5)
-    return format_results(results, "Google Drive")
+    # Strategy answers come from the document body, so fetch full content
+    results = await glean_search(query, datasources=_STRATEGY_SOURCES, num_results=5, content_level="full")
+    return format_results(results, "Google Drive", max_chars=2000)
 
 
-def search_communications(query: str) -> str:
+async def search_communications(query: str) -> str:
     """
     Search Gong, Slack, Gmail for calls, messages, and communications.
     Use this for: call sentiment, recent meetings, email threads, Slack discussions.
@@ -442,20 +654,45 @@ def search_communications(query: str) -> str:
     The query should include the account/company name prominently.
     Example: "AdventHealth recent call" or "JPMC meeting sentiment"
     """
-    results = glean_search(query, datasources=["gong", "slack", "gmail"], num_results=9)
+    results = await glean_search(query, datasources=_COMMUNICATION_SOURCES, num_results=9)
     return format_results(results, "Communications (Gong/Slack/Gmail)")
 
 
-def search_general_fallback(query: str) -> str:
+async def search_general_fallback(query: str) -> str:
     """
     Search ALL sources without any datasource filtering.
     Use this as a last resort when other tools don't find relevant results.
     Only use when user explicitly approves searching all sources.
     """
-    results = glean_search(query, datasources=None, num_results=10)
+    # Unfiltered results are too broad to be worth reusing, so skip the cache
+    results = await glean_search(query, datasources=None, num_results=10, use_cache=False)
     return format_results(results, "All Sources")
 
 
+# Domain searches combined by search_account_360, in output order
+ACCOUNT_360_TOOLS = (
+    search_salesforce_opportunities,
+    search_salesforce_accounts,
+    search_salesforce_contacts,
+    search_metrics_and_dashboards,
+    search_strategy_docs,
+    search_communications,
+)
+
+
+async def search_account_360(account: str) -> str:
+    """
+    Run every domain search for an account concurrently.
+    Use this for: status summaries, meeting prep, account overviews.
+    
+    One tool call replaces the several LLM round-trips it would otherwise
+    take to gather the same picture.
+    Example: "AdventHealth"
+    """
+    results = await asyncio.gather(*(tool(account) for tool in ACCOUNT_360_TOOLS))
+    return "\n\n---\n\n".join(results)
+
+
 TOOLS = {
     "search_salesforce_opportunities": search_salesforce_opportunities,
     "search_salesforce_accounts": search_salesforce_accounts,
@@ -464,119 +701,385 @@ TOOLS = {
     "search_strategy_docs": search_strategy_docs,
     "search_communications": search_communications,
     "search_general_fallback": search_general_fallback,
+    "search_account_360": search_account_360,
 }
 
-TOOL_SPECS = [
-    {
+def _tool_spec(name: str, description: str, query_description: str, param: str = "query") -> dict:
+    """Build a Responses API function spec for a tool taking a single string argument."""
+    return {
         "type": "function",
-        "function": {
-            "name": "search_salesforce_opportunities",
-            "description": "Search Salesforce OPPORTUNITIES for renewals, contracts, deals, close dates. Query MUST start with the account name. Example: 'AdventHealth renewal date' or 'Target contract'",
-            "parameters": {
-                "type": "object",
-                "properties": {"query": {"type": "string", "description": "Query starting with account name, e.g., 'AdventHealth renewal'"}},
-                "required": ["query"]
-            }
+        "name": name,
+        "description": description,
+        "parameters": {
+            "type": "object",
+            "properties": {param: {"type": "string", "description": query_description}},
+            "required": [param]
         }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "search_salesforce_accounts",
-            "description": "Search Salesforce ACCOUNT records for company info, account overview. Query MUST start with the account name. Example: 'AdventHealth account overview'",
-            "parameters": {
-                "type": "object",
-                "properties": {"query": {"type": "string", "description": "Query starting with account name, e.g., 'JPMC account'"}},
-                "required": ["query"]
-            }
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "search_salesforce_contacts",
-            "description": "Search Salesforce CONTACTS for decision makers, stakeholders, executives. Query MUST start with the account name. Example: 'AdventHealth contacts' or 'Target decision makers'",
-            "parameters": {
-                "type": "object",
-                "properties": {"query": {"type": "string", "description": "Query starting with account name, e.g., 'AdventHealth contacts'"}},
-                "required": ["query"]
-            }
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "search_metrics_and_dashboards",
-            "description": "Search Salesforce and Looker for funding caps, spend, enrollments, dashboards. Query should include account name.",
-            "parameters": {
-                "type": "object",
-                "properties": {"query": {"type": "string", "description": "Query with account name, e.g., 'JPMC funding cap'"}},
-                "required": ["query"]
-            }
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "search_strategy_docs",
-            "description": "Search Google Drive for QBRs, Account Plans, strategy documents. Query should include account name.",
-            "parameters": {
-                "type": "object",
-                "properties": {"query": {"type": "string", "description": "Query with account name, e.g., 'AdventHealth QBR'"}},
-                "required": ["query"]
-            }
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "search_communications",
-            "description": "Search Gong, Slack, Gmail for calls, sentiment, messages. Query should include account name.",
-            "parameters": {
-                "type": "object",
-                "properties": {"query": {"type": "string", "description": "Query with account name, e.g., 'AdventHealth recent call'"}},
-                "required": ["query"]
-            }
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "search_general_fallback",
-            "description": "Search ALL sources without filtering. Only use when user explicitly approves fallback after other tools fail.",
-            "parameters": {
-                "type": "object",
-                "properties": {"query": {"type": "string", "description": "Search query"}},
-                "required": ["query"]
-            }
-        }
-    },
+    }
+
+
+TOOL_SPECS = [
+    _tool_spec(
+        "search_salesforce_opportunities",
+        "Search Salesforce OPPORTUNITIES for renewals, contracts, deals, close dates. Query MUST start with the account name. Example: 'AdventHealth renewal date' or 'Target contract'",
+        "Query starting with account name, e.g., 'AdventHealth renewal'",
+    ),
+    _tool_spec(
+        "search_salesforce_accounts",
+        "Search Salesforce ACCOUNT records for company info, account overview. Query MUST start with the account name. Example: 'AdventHealth account overview'",
+        "Query starting with account name, e.g., 'JPMC account'",
+    ),
+    _tool_spec(
+        "search_salesforce_contacts",
+        "Search Salesforce CONTACTS for decision makers, stakeholders, executives. Query MUST start with the account name. Example: 'AdventHealth contacts' or 'Target decision makers'",
+        "Query starting with account name, e.g., 'AdventHealth contacts'",
+    ),
+    _tool_spec(
+        "search_metrics_and_dashboards",
+        "Search Salesforce and Looker for funding caps, spend, enrollments, dashboards. Query should include account name.",
+        "Query with account name, e.g., 'JPMC funding cap'",
+    ),
+    _tool_spec(
+        "search_strategy_docs",
+        "Search Google Drive for QBRs, Account Plans, strategy documents. Query should include account name.",
+        "Query with account name, e.g., 'AdventHealth QBR'",
+    ),
+    _tool_spec(
+        "search_communications",
+        "Search Gong, Slack, Gmail for calls, sentiment, messages. Query should include account name.",
+        "Query with account name, e.g., 'AdventHealth recent call'",
+    ),
+    _tool_spec(
+        "search_general_fallback",
+        "Search ALL sources without filtering. Only use when user explicitly approves fallback after other tools fail.",
+        "Search query",
+    ),
+    _tool_spec(
+        "search_account_360",
+        "Use this when the user asks for a status summary, meeting prep, or account overview. Runs the opportunity, account, contact, metrics, strategy and communications searches in one call.",
+        "Account name only, e.g., 'AdventHealth'",
+        param="account",
+    ),
 ]
 
 
+# =============================================================================
+# RESULT CACHE
+# =============================================================================
+
+class TTLCache:
+    """Small LRU cache whose entries expire after `ttl` seconds."""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+    
+    def get(self, key: Any) -> Any:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        
+        self._data.move_to_end(key)
+        return value
+    
+    def set(self, key: Any, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value, evicting the least recently used entry when full.
+        
+        `ttl` overrides the cache's lifetime for this entry, e.g. to keep a
+        value promoted from a slower cache no longer than it had left there.
+        """
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._data.clear()
+
+
+# Set CACHE_BYPASS=1 (or pass --no-cache) to always hit Glean - useful
+# when debugging tools
+_cache_bypass = os.environ.get("CACHE_BYPASS", "").lower() in ("1", "true", "yes")
+
+# Glean results keyed by _search_key, shared by every tool. The LLM re-asks
+# the same account questions a lot within a session.
+_search_cache = TTLCache(maxsize=1024, ttl=600)
+
+
+class DiskCache:
+    """
+    TTL cache in a local SQLite file, so results survive CLI restarts.
+    
+    Sits behind the in-memory cache. Any SQLite or filesystem error is
+    treated as a miss - the cache must never break a search. The file holds
+    search content, so it is readable by the current user only.
+    """
+    
+    # Expired rows are purged on connect and after every this many sets
+    PURGE_EVERY = 100
+    
+    def __init__(self, path: str, ttl: float):
+        self.path = path
+        self.ttl = ttl
+        self._conn: Optional[sqlite3.Connection] = None
+        self._sets = 0
+        # get/set run on worker threads; one connection, one at a time
+        self._lock = threading.Lock()
+    
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), mode=0o700, exist_ok=True)
+            os.close(os.open(self.path, os.O_CREAT | os.O_RDWR, 0o600))
+            os.chmod(self.path, 0o600)  # tighten files created by older versions
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache "
+                "(key TEXT PRIMARY KEY, expires_at REAL, value TEXT)"
+            )
+            self._purge()
+        return self._conn
+    
+    def _purge(self) -> None:
+        self._conn.execute("DELETE FROM cache WHERE expires_at < ?", (time.time(),))
+        self._conn.commit()
+    
+    def get_entry(self, key: str) -> Optional[tuple[Any, float]]:
+        """Return (value, seconds until it expires), or None if missing or expired."""
+        now = time.time()
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT value, expires_at FROM cache WHERE key = ? AND expires_at > ?",
+                    (key, now)
+                ).fetchone()
+        except (sqlite3.Error, OSError):
+            return None
+        return (_json_loads(row[0]), row[1] - now) if row else None
+    
+    def get(self, key: str) -> Any:
+        """Return the cached value, or None if missing or expired."""
+        entry = self.get_entry(key)
+        return entry[0] if entry else None
+    
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache VALUES (?, ?, ?)",
+                    (key, time.time() + self.ttl, json.dumps(value))
+                )
+                conn.commit()
+                self._sets += 1
+                if self._sets % self.PURGE_EVERY == 0:
+                    self._purge()
+        except (sqlite3.Error, OSError):
+            pass
+    
+    async def aget_entry(self, key: str) -> Optional[tuple[Any, float]]:
+        """get_entry() on a worker thread, keeping SQLite I/O off the event loop."""
+        return await asyncio.to_thread(self.get_entry, key)
+    
+    async def aset(self, key: str, value: Any) -> None:
+        """set() on a worker thread, keeping SQLite I/O off the event loop."""
+        await asyncio.to_thread(self.set, key, value)
+    
+    async def aclear(self) -> None:
+        """clear() on a worker thread, keeping SQLite I/O off the event loop."""
+        await asyncio.to_thread(self.clear)
+    
+    def clear(self) -> None:
+        """Drop all entries."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute("DELETE FROM cache")
+                conn.commit()
+        except (sqlite3.Error, OSError):
+            pass
+
+
+# Glean results persisted across sessions; AMs rerun the CLI many times a day
+_disk_cache = DiskCache(os.path.expanduser("~/.eps_agent/glean_cache.sqlite3"), ttl=1800)
+
+
+def _disk_cache_key(key: tuple) -> str:
+    """
+    Hash a search key for the disk cache.
+    
+    Includes the Glean instance and token: results depend on who is asking,
+    so one user's cached results must never be served to another.
+    """
+    raw = json.dumps([_glean_instance, _glean_api_token, *key])
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+# Accounts to pre-load into the result cache at startup, e.g.
+# EPS_WARM_ACCOUNTS="AdventHealth,JPMC" - the AM's active book of business
+WARM_ACCOUNTS = [a.strip() for a in os.environ.get("EPS_WARM_ACCOUNTS", "").split(",") if a.strip()]
+
+# Background warming shares Glean with the user's own searches; keep it light
+_WARM_CONCURRENCY = 2
+
+
+async def warm_result_cache(accounts: list[str]) -> None:
+    """
+    Run the most common searches for each account in the background.
+    
+    Results land in the memory and disk caches, so the user's first
+    questions about these accounts are cache hits. Each search uses the
+    same arguments as its tool, so the cache keys match. Nothing is warmed
+    when the cache is bypassed, since nothing would be stored.
+    """
+    if _cache_bypass or not accounts:
+        return
+    
+    _quiet_searches.set(True)  # this task runs in its own context copy
+    limit = asyncio.Semaphore(_WARM_CONCURRENCY)
+    
+    async def warm(query: str, **kwargs: Any) -> None:
+        async with limit:
+            await glean_search(query, **kwargs)
+    
+    searches = []
+    for account in accounts:
+        searches += [
+            # Same arguments as search_salesforce_opportunities,
+            # search_salesforce_accounts and search_strategy_docs
+            warm(f"{account} renewal", datasources=_SALESFORCE, num_results=5, facet_filters=_OPPORTUNITY_FILTER),
+            warm(f"{account} account", datasources=_SALESFORCE, num_results=5, facet_filters=_ACCOUNT_FILTER),
+            warm(f"{account} QBR", datasources=_STRATEGY_SOURCES, num_results=5, content_level="full"),
+        ]
+    await asyncio.gather(*searches, return_exceptions=True)
+
+
+# =============================================================================
+# HISTORY COMPACTION
+# =============================================================================
+
+_RESULT_TITLE = re.compile(r"^\*\*\[\d+\] (.+?)\*\*", re.MULTILINE)
+
+# Longest prior answer kept verbatim in a recap
+_RECAP_ANSWER_CHARS = 600
+
+
+def summarize_tool_result(name: str, arguments: str, result: str) -> str:
+    """Collapse a formatted tool result into a one-line summary."""
+    try:
+        query = _json_loads(arguments).get("query", "")
+    except ValueError:
+        query = ""
+    
+    titles = _RESULT_TITLE.findall(result)[:3]
+    outcome = "; ".join(titles) if titles else result.split("\n", 1)[0][:120]
+    return f'Prior search: {name}("{query}") → {outcome}'
+
+
+def build_recap(turns: list[dict]) -> str:
+    """Compact recap of earlier turns, sent as the first input of a new chain."""
+    lines = ["Summary of the conversation so far (earlier search results condensed):"]
+    for turn in turns[-HISTORY_RECAP_TURNS:]:
+        answer = turn["answer"]
+        if len(answer) > _RECAP_ANSWER_CHARS:
+            answer = answer[:_RECAP_ANSWER_CHARS] + "..."
+        lines.append(f"\nUser: {turn['user']}")
+        lines.extend(turn["searches"])
+        lines.append(f"Assistant: {answer}")
+    return "\n".join(lines)
+
+
+def _input_chars(input_items: list[dict]) -> int:
+    """Rough size of the input sent in one request."""
+    return sum(len(item.get("content") or item.get("output") or "") for item in input_items)
+
+
 # =============================================================================
 # AGENT
 # =============================================================================
 
+class LiveStatus:
+    """
+    One Rich live region reused for every turn of the session.
+    
+    Shows a spinner with the current step and, while the answer streams in,
+    the text received so far. Used as a context manager around each turn.
+    Does nothing when output isn't a terminal (piped or CI runs), so no
+    refresh thread runs and nothing is rendered there.
+    """
+    
+    def __init__(self):
+        self.enabled = console.is_terminal
+        self.spinner = Spinner("dots")
+        self.live = Live(self.spinner, console=console, transient=True, refresh_per_second=10)
+        self.streamed: Optional[Text] = None
+    
+    def __enter__(self) -> "LiveStatus":
+        if self.enabled:
+            self.show("Thinking...")
+            self.live.start()
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        if self.enabled:
+            self.live.stop()
+    
+    def show(self, label: str) -> None:
+        """Show the spinner with a new label, dropping any streamed text."""
+        if not self.enabled:
+            return
+        self.spinner.update(text=f"[bold cyan]{label}[/bold cyan]")
+        self.live.update(self.spinner)
+        self.streamed = None
+    
+    def stream(self, delta: str) -> None:
+        """
+        Append a chunk of the streaming answer below a "Writing..." spinner.
+        
+        The text is one growing Text object; Live redraws it at its own
+        refresh rate, so each chunk costs an append rather than a rebuild.
+        """
+        if not self.enabled:
+            return
+        if self.streamed is None:
+            self.streamed = Text(style="dim")
+            self.spinner.update(text="[bold cyan]Writing...[/bold cyan]")
+            self.live.update(Group(self.spinner, self.streamed))
+        self.streamed.append(delta)
+
+
 class EPSAgentCLI:
     """Simple CLI agent using OpenAI Responses pattern."""
     
     def __init__(self):
-        self.client = OpenAI()
-        self.messages = [{"role": "system", "content": SYSTEM_PROMPT}]
+        self.client = AsyncOpenAI()
+        # Conversation state lives on OpenAI's side; each request sends only
+        # the new input and points at the previous response
+        self.previous_response_id: Optional[str] = None
+        # Size of the current chain, and the finished turns a new chain's
+        # recap is built from
+        self.chain_turns = 0
+        self.chain_chars = 0
+        self.turns: list[dict] = []
+        self.status = LiveStatus()
     
-    def execute_tool(self, name: str, args: dict) -> str:
-        """Execute a tool and return the result."""
-        if name not in TOOLS:
-            return f"Unknown tool: {name}"
-        
-        # Show tool call with args
+    def print_tool_call(self, name: str, args: dict) -> None:
+        """Show a tool call with its args."""
         console.print(f"\n  [bold cyan]🔧 {name}[/bold cyan]")
-        console.print(f"  [dim]   Query: \"{args.get('query', '')}\"[/dim]")
-        
-        result = TOOLS[name](**args)
-        
-        # Show snippet of results
+        arg_text = ", ".join(f"{k}={v!r}" for k, v in args.items())
+        console.print(Text(f"     {arg_text}", style="dim"))
+    
+    def print_tool_result(self, result: str) -> None:
+        """Show a snippet of a tool result."""
         lines = result.split('\n')
         preview_lines = lines[:8]  # Show first 8 lines
         preview = '\n'.join(preview_lines)
@@ -589,81 +1092,200 @@ class EPSAgentCLI:
             border_style="dim",
             padding=(0, 1)
         ))
+    
+    async def execute_tool(self, name: str, args: dict) -> str:
+        """Execute a tool and return the result."""
+        tool = TOOLS.get(name)
+        if tool is None:
+            return f"Unknown tool: {name}"
+        
+        return await tool(**args)
+    
+    async def run_tool_call(self, name: str, arguments: str) -> str:
+        """Parse a tool call's JSON arguments, then execute it."""
+        args = _json_loads(arguments)
+        self.print_tool_call(name, args)
+        return await self.execute_tool(name, args)
+    
+    async def stream_llm(
+        self, input_items: list[dict], previous_response_id: Optional[str]
+    ) -> tuple[Optional[str], list[dict], list[asyncio.Task], str]:
+        """
+        Stream one LLM response.
+        
+        Each tool call is started as soon as its output item is complete, so
+        Glean searches overlap with the rest of the decode instead of waiting
+        for the response to finish. Repeated calls (same tool, same arguments)
+        share the first call's task, so each still gets its own output but
+        runs only once.
+        
+        Returns:
+            (content, tool_calls, tasks, response_id) - tasks[i] executes tool_calls[i]
+        """
+        stream = await self.client.responses.create(
+            model=LLM_MODEL,
+            # Sent on every request (instructions don't carry over from the
+            # previous response); identical bytes keep the prompt cache hitting
+            instructions=SYSTEM_PROMPT,
+            input=input_items,
+            previous_response_id=previous_response_id,
+            tools=TOOL_SPECS,
+            truncation="auto",
+            stream=True,
+            extra_body={"prompt_cache_key": PROMPT_CACHE_KEY},
+        )
+        
+        content_parts = []
+        tool_calls: list[dict] = []
+        tasks: list[asyncio.Task] = []
+        started: dict[tuple[str, str], asyncio.Task] = {}
+        response_id = None
+        
+        try:
+            async for event in stream:
+                if event.type == "response.output_text.delta":
+                    content_parts.append(event.delta)
+                    self.status.stream(event.delta)
+                
+                elif event.type == "response.output_item.done" and event.item.type == "function_call":
+                    item = event.item
+                    call = {"id": item.call_id, "name": item.name, "arguments": item.arguments}
+                    tool_calls.append(call)
+                    
+                    key = (call["name"], call["arguments"].strip())
+                    task = started.get(key)
+                    if task is None:
+                        task = asyncio.create_task(self.run_tool_call(call["name"], call["arguments"]))
+                        started[key] = task
+                    tasks.append(task)
+                
+                elif event.type == "response.completed":
+                    response_id = event.response.id
+                
+                elif event.type == "response.failed":
+                    raise RuntimeError(f"LLM response failed: {event.response.error}")
+                
+                elif event.type == "error":
+                    raise RuntimeError(f"LLM error: {event.message}")
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        
+        if response_id is None:
+            for task in tasks:
+                task.cancel()
+            raise RuntimeError("LLM stream ended before the response completed")
         
-        return result
+        return "".join(content_parts) or None, tool_calls, tasks, response_id
     
-    def chat(self, user_message: str) -> str:
+    async def chat(self, user_message: str) -> str:
         """Process a user message and return the response."""
-        self.messages.append({"role": "user", "content": user_message})
+        input_items: list[dict] = [{"role": "user", "content": user_message}]
+        
+        # A long chain is re-prefilled on every request; start a new one
+        # that carries a recap instead of the full tool outputs
+        if self.chain_turns >= HISTORY_CHAIN_TURNS or self.chain_chars > HISTORY_CHAR_BUDGET:
+            self.previous_response_id = None
+            self.chain_turns = 0
+            self.chain_chars = 0
+        if self.previous_response_id is None and self.turns:
+            input_items.insert(0, {"role": "developer", "content": build_recap(self.turns)})
+        
+        previous_response_id = self.previous_response_id
+        searches: list[str] = []
+        turn_chars = 0
         
         max_iterations = 10
         iteration = 0
         
         for iteration in range(max_iterations):
-            # Call the LLM
-            response = self.client.chat.completions.create(
-                model=LLM_MODEL,
-                messages=self.messages,
-                tools=TOOL_SPECS,
+            # Call the LLM (tool calls start while it is still streaming)
+            self.status.show("Thinking...")
+            content, tool_calls, tasks, previous_response_id = await self.stream_llm(
+                input_items, previous_response_id
             )
-            
-            assistant_message = response.choices[0].message
+            turn_chars += _input_chars(input_items) + len(content or "")
             
             # Show thinking/reasoning if present (before tool calls)
-            if assistant_message.content and assistant_message.tool_calls:
+            if content and tool_calls:
                 console.print(f"\n[bold yellow]💭 Thinking:[/bold yellow]")
-                console.print(f"[dim]{assistant_message.content}[/dim]")
+                console.print(f"[dim]{content}[/dim]")
             
-            # If no tool calls, we're done
-            if not assistant_message.tool_calls:
-                self.messages.append({
-                    "role": "assistant",
-                    "content": assistant_message.content
-                })
+            # If no tool calls, we're done. Only a finished turn becomes the
+            # base for the next one - a response still waiting on tool
+            # outputs can't be continued with a new user message.
+            if not tool_calls:
+                self.previous_response_id = previous_response_id
+                self.chain_turns += 1
+                self.chain_chars += turn_chars
+                self.turns.append({"user": user_message, "searches": searches, "answer": content or ""})
+                del self.turns[:-HISTORY_RECAP_TURNS]
                 if iteration > 0:
                     console.print(f"\n[dim]✓ Completed after {iteration + 1} LLM call(s)[/dim]")
-                return assistant_message.content
+                return content
             
-            # Show which tools will be called
-            tool_names = [tc.function.name for tc in assistant_message.tool_calls]
-            console.print(f"\n[dim]📋 Planning to call: {', '.join(tool_names)}[/dim]")
+            # Tool calls in one turn are independent and already running
+            # concurrently - the turn costs the slowest Glean round-trip
+            self.status.show(f"Searching ({len(set(tasks))} tool call(s))...")
+            results = await asyncio.gather(*tasks, return_exceptions=True)
             
-            # Execute tool calls
-            self.messages.append({
-                "role": "assistant",
-                "content": assistant_message.content,
-                "tool_calls": [
-                    {
-                        "id": tc.id,
-                        "type": "function",
-                        "function": {
-                            "name": tc.function.name,
-                            "arguments": tc.function.arguments
-                        }
-                    }
-                    for tc in assistant_message.tool_calls
-                ]
-            })
-            
-            for tool_call in assistant_message.tool_calls:
-                args = json.loads(tool_call.function.arguments)
-                result = self.execute_tool(tool_call.function.name, args)
+            # The next request sends just the tool outputs, in the order the
+            # model emitted the calls
+            input_items = []
+            for call, result in zip(tool_calls, results):
+                if isinstance(result, Exception):
+                    result = f"Tool error ({call['name']}): {result}"
+                self.print_tool_result(result)
+                searches.append(summarize_tool_result(call["name"], call["arguments"], result))
                 
-                self.messages.append({
-                    "role": "tool",
-                    "tool_call_id": tool_call.id,
-                    "content": result
+                input_items.append({
+                    "type": "function_call_output",
+                    "call_id": call["id"],
+                    "output": result
                 })
         
         return "Max iterations reached. Please try a more specific query."
     
-    def reset(self):
-        """Reset conversation history."""
-        self.messages = [{"role": "system", "content": SYSTEM_PROMPT}]
+    async def reset(self):
+        """Reset conversation history and cached search results."""
+        self.previous_response_id = None
+        self.chain_turns = 0
+        self.chain_chars = 0
+        self.turns.clear()
+        _search_cache.clear()
+        await _disk_cache.aclear()
         console.print("[dim]Conversation reset.[/dim]")
 
 
-def main():
+async def read_input(prompt: str) -> str:
+    """
+    Read a line from the user without blocking the event loop.
+    
+    Background tasks (e.g. cache warming) keep running while the user
+    types. Uses a daemon thread rather than asyncio.to_thread: a prompt left
+    unanswered at Ctrl+C would otherwise keep asyncio.run from shutting down.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def deliver(setter: Callable, value: Any) -> None:
+        if not future.done():
+            setter(value)
+    
+    def read() -> None:
+        try:
+            line = console.input(prompt)
+        except BaseException as e:
+            loop.call_soon_threadsafe(deliver, future.set_exception, e)
+        else:
+            loop.call_soon_threadsafe(deliver, future.set_result, line)
+    
+    threading.Thread(target=read, daemon=True).start()
+    return await future
+
+
+async def main():
     """Main CLI loop."""
     global _glean_api_token, _glean_instance
     
@@ -687,9 +1309,7 @@ def main():
         sys.exit(1)
     
     # Resolve Glean instance for display
-    glean_display = _glean_instance
-    if "." not in _glean_instance:
-        glean_display = f"{_glean_instance}-be.glean.com"
+    glean_display = _glean_host(_glean_instance)
     
     # Print header
     console.print(Panel.fit(
@@ -697,53 +1317,91 @@ def main():
         "[dim]OpenAI Responses Pattern - CLI Version[/dim]\n\n"
         f"Model: {LLM_MODEL}\n"
         f"Glean: {glean_display}\n\n"
-        "[dim]Commands: 'quit' to exit, 'reset' to clear history[/dim]",
+        "[dim]Commands: 'quit' (or 'exit', 'q') to exit, 'reset' to clear history[/dim]",
         title="🤖 EPS Agent",
         border_style="cyan"
     ))
     
-    # Test Glean connection
-    console.print("\n[dim]Testing Glean connection...[/dim]")
-    test_results = glean_search("test", num_results=1)
-    if test_results and not test_results[0].get("error"):
-        console.print("[green]✓ Glean connected![/green]\n")
-    else:
-        console.print(f"[yellow]⚠️ Glean test: {test_results}[/yellow]\n")
-    
     # Create agent
     agent = EPSAgentCLI()
     
+    # Test Glean and warm up the OpenAI connection concurrently
+    warmup_status = console.status("[dim]Warming up...[/dim]") if console.is_terminal else contextlib.nullcontext()
+    with warmup_status:
+        test_results, openai_warmup = await asyncio.gather(
+            glean_search("test", num_results=1, content_level="meta", use_cache=False),
+            agent.client.models.retrieve(LLM_MODEL),
+            return_exceptions=True,
+        )
+    
+    if isinstance(test_results, list) and test_results and not test_results[0].get("error"):
+        console.print("\n[green]✓ Glean connected![/green]")
+    else:
+        console.print(f"\n[yellow]⚠️ Glean test: {test_results}[/yellow]")
+    
+    if isinstance(openai_warmup, Exception):
+        console.print(f"[yellow]⚠️ OpenAI warmup: {openai_warmup}[/yellow]\n")
+    else:
+        console.print("[green]✓ OpenAI connected![/green]\n")
+    
+    # Cache warming starts after the connection checks so it doesn't delay
+    # them, and runs while the user types their first question
+    cache_warmup = asyncio.create_task(warm_result_cache(WARM_ACCOUNTS))
+    
     # Main loop
     while True:
         try:
-            user_input = console.input("\n[bold green]You:[/bold green] ").strip()
+            user_input = (await read_input("\n[bold green]You:[/bold green] ")).strip()
             
             if not user_input:
                 continue
             
-            if user_input.lower() == "quit":
+            if user_input.lower() in _EXIT_COMMANDS:
                 console.print("[dim]Goodbye![/dim]")
                 break
             
             if user_input.lower() == "reset":
-                agent.reset()
+                await agent.reset()
                 continue
             
             console.print()
             
-            with console.status("[bold cyan]Thinking...[/bold cyan]"):
-                response = agent.chat(user_input)
+            with agent.status:
+                response = await agent.chat(user_input)
             
             console.print("\n[bold blue]Agent:[/bold blue]")
             console.print(Markdown(response))
             
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, EOFError, asyncio.CancelledError):
+            # Ctrl+C arrives as a cancellation of this task under asyncio.run
             console.print("\n[dim]Goodbye![/dim]")
             break
         except Exception as e:
             console.print(f"[red]Error: {e}[/red]")
+    
+    cache_warmup.cancel()
+    await close_http_client()
+
+
+def run() -> None:
+    """Run the CLI, on uvloop when it is installed (faster socket I/O)."""
+    global _cache_bypass
+    
+    parser = argparse.ArgumentParser(description="EPS Account Intelligence Agent CLI")
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="always query Glean instead of reusing recent results"
+    )
+    args = parser.parse_args()
+    if args.no_cache:
+        _cache_bypass = True
+    
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
+    asyncio.run(main())
 
 
 if __name__ == "__main__":
-    main()
+    run()
 
@@ -7,60 +7,170 @@ Each tool can be tested independently to see raw results.
 
 Usage:
     python tool_lab.py
+    python tool_lab.py --concurrency 8   # run the suite on 8 threads
+    python tool_lab.py --warmup          # open the Glean connection first
 
 Or in Python:
     from tool_lab import test_salesforce_opportunities
     test_salesforce_opportunities("AdventHealth renewal")
 """
 
+import asyncio
+import atexit
+import io
 import json
 import os
-from typing import Optional
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Any, Optional
 from dotenv import load_dotenv
 import httpx
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+try:
+    import h2  # lets httpx multiplex concurrent requests over one HTTP/2 connection
+except ImportError:  # optional speedup
+    h2 = None
+
 # Load environment variables
 load_dotenv()
 
 GLEAN_API_TOKEN = os.environ.get("GLEAN_API_TOKEN")
 GLEAN_INSTANCE = os.environ.get("GLEAN_INSTANCE")
 
+# Glean responses run to tens of KB; parse them with orjson when installed
+_json_loads = orjson.loads if orjson else json.loads
+
+
+def _json_body(payload: dict) -> bytes:
+    """Encode a request body, with orjson when installed."""
+    if orjson:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode()
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 # =============================================================================
 # GLEAN API CORE
 # =============================================================================
 
-def get_glean_api_url() -> str:
-    """Get the Glean API URL."""
-    if not GLEAN_INSTANCE:
-        raise RuntimeError("GLEAN_INSTANCE not set")
+def _build_glean_api_url(instance: Optional[str]) -> Optional[str]:
+    """Build the search endpoint URL for a Glean instance setting."""
+    if not instance:
+        return None
     
-    clean = GLEAN_INSTANCE.replace("https://", "").replace("http://", "").rstrip("/")
+    clean = instance.replace("https://", "").replace("http://", "").rstrip("/")
     if "." not in clean:
         clean = f"{clean}-be.glean.com"
     
     return f"https://{clean}/rest/api/v1/search"
 
 
-def glean_search_raw(
-    query: str,
-    datasources: Optional[list[str]] = None,
-    num_results: int = 10,
-    facet_filters: Optional[list[dict]] = None,
-    debug: bool = True
-) -> dict:
-    """
-    Raw Glean search - returns full API response for debugging.
-    """
-    if not GLEAN_API_TOKEN:
-        raise RuntimeError("GLEAN_API_TOKEN not set")
+# Resolved once at import; None when GLEAN_INSTANCE is not set
+GLEAN_API_URL = _build_glean_api_url(GLEAN_INSTANCE)
+
+
+def get_glean_api_url() -> str:
+    """Get the Glean API URL."""
+    if not GLEAN_API_URL:
+        raise RuntimeError("GLEAN_INSTANCE not set")
+    return GLEAN_API_URL
+
+
+# Auth header shared by every client, built once
+_AUTH_HEADERS = {"Authorization": f"Bearer {GLEAN_API_TOKEN}"} if GLEAN_API_TOKEN else {}
+
+
+# Shared HTTP client so repeated searches reuse keep-alive connections
+# instead of paying a TCP + TLS handshake each time
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+# Retry failed connection attempts (not failed requests) a few times
+_CONNECT_RETRIES = 3
+
+
+def _get_http_client() -> httpx.Client:
+    """Get the shared Glean HTTP client, creating it on first use."""
+    global _http_client
     
-    headers = {"Authorization": f"Bearer {GLEAN_API_TOKEN}"}
+    if _http_client is None:
+        # Parallel suite workers can get here together; only one may build it
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = httpx.Client(
+                    timeout=30.0,
+                    transport=httpx.HTTPTransport(
+                        retries=_CONNECT_RETRIES,
+                        http2=h2 is not None,
+                        limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+                    ),
+                    headers=_AUTH_HEADERS,
+                )
+                atexit.register(_http_client.close)
+    return _http_client
+
+
+@dataclass(frozen=True, slots=True)
+class FacetFilter:
+    """One facet condition, e.g. FacetFilter("type", "opportunity")."""
+    field: str
+    value: str
+    relation: str = "EQUALS"
+
+
+@lru_cache(maxsize=128)
+def to_filter_list(*conditions: FacetFilter) -> list[dict]:
+    """
+    Glean facetFilters for the given conditions.
     
-    request_options = {
-        "facetBucketSize": 100,
-        "returnLlmContentOverSnippets": True,
-    }
+    Conditions on the same field share one entry. The list is cached per
+    set of conditions, so callers must not mutate it.
+    """
+    values_by_field: dict[str, list[dict]] = {}
+    for condition in conditions:
+        values_by_field.setdefault(condition.field, []).append(
+            {"relationType": condition.relation, "value": condition.value}
+        )
+    return [{"fieldName": field, "values": values} for field, values in values_by_field.items()]
+
+
+# Glean returns facets, result counts and tabs unless told otherwise. Most
+# tests only read results; discovery and inspection pass None for everything.
+RESULTS_ONLY = ("RESULTS",)
+
+
+# requestOptions sent with every search; per-call options are layered on top
+_BASE_REQUEST_OPTIONS = {
+    "facetBucketSize": 100,
+    "returnLlmContentOverSnippets": True,
+}
+
+
+def _build_search_payload(
+    query: str,
+    datasources: Optional[list[str]],
+    num_results: int,
+    facet_filters: Optional[list[dict]],
+    max_snippet_size: int,
+    cursor: Optional[str] = None,
+    response_hints: Optional[tuple[str, ...]] = None
+) -> dict:
+    """Build the Glean search request body (`cursor` requests a later page)."""
+    request_options = dict(_BASE_REQUEST_OPTIONS)
     
     if datasources:
         request_options["datasourcesFilter"] = datasources
@@ -68,33 +178,358 @@ def glean_search_raw(
     if facet_filters:
         request_options["facetFilters"] = facet_filters
     
+    if response_hints:
+        request_options["responseHints"] = list(response_hints)
+    
     payload = {
         "query": query,
         "pageSize": num_results,
-        "maxSnippetSize": 4000,
+        "maxSnippetSize": max_snippet_size,
         "requestOptions": request_options
     }
+    if cursor:
+        payload["cursor"] = cursor
+    return payload
+
+
+# Identical searches are re-issued a lot while iterating interactively; keep
+# responses briefly so permission changes still show up after a few minutes
+_SEARCH_MEMO_SIZE = 256
+_SEARCH_MEMO_TTL = 300.0
+_search_memo: "OrderedDict[tuple, tuple[float, dict]]" = OrderedDict()
+
+
+def _search_memo_key(
+    query: str,
+    datasources: Optional[list[str]],
+    num_results: int,
+    facet_filters: Optional[list[dict]],
+    max_snippet_size: int,
+    cursor: Optional[str] = None,
+    response_hints: Optional[tuple[str, ...]] = None
+) -> tuple:
+    """Hashable key for a search - facet filters are canonicalised as JSON."""
+    return (
+        query,
+        tuple(datasources) if datasources else (),
+        num_results,
+        json.dumps(facet_filters, sort_keys=True) if facet_filters else "",
+        max_snippet_size,
+        cursor or "",
+        response_hints or (),
+    )
+
+
+_search_memo_lock = threading.Lock()  # run_all_tests can search from several threads
+
+
+def _memo_get(key: tuple) -> Optional[dict]:
+    """Return a memoized response, or None if missing or expired."""
+    with _search_memo_lock:
+        entry = _search_memo.get(key)
+        if entry is None:
+            return None
+        
+        stored_at, response = entry
+        if time.monotonic() - stored_at > _SEARCH_MEMO_TTL:
+            del _search_memo[key]
+            return None
+        
+        _search_memo.move_to_end(key)
+        return response
+
+
+def _memo_set(key: tuple, response: dict) -> None:
+    """Memoize a response, evicting the least recently used beyond the cap."""
+    with _search_memo_lock:
+        _search_memo[key] = (time.monotonic(), response)
+        _search_memo.move_to_end(key)
+        while len(_search_memo) > _SEARCH_MEMO_SIZE:
+            _search_memo.popitem(last=False)
+
+
+def _memo_clear() -> None:
+    """Drop every memoized response (discovery probes included)."""
+    with _search_memo_lock:
+        _search_memo.clear()
+
+
+def glean_search_raw(
+    query: str,
+    datasources: Optional[list[str]] = None,
+    num_results: int = 10,
+    facet_filters: Optional[list[dict]] = None,
+    debug: bool = False,
+    max_snippet_size: int = 512,
+    cursor: Optional[str] = None,
+    response_hints: Optional[tuple[str, ...]] = RESULTS_ONLY
+) -> dict:
+    """
+    Raw Glean search - returns full API response for debugging.
+    
+    Snippets are capped at `max_snippet_size` chars. The default covers the
+    200-char previews printed here; pass a larger size when inspecting
+    full document content. Pass the `cursor` from a previous response to
+    get the next page. Only results come back by default; pass
+    response_hints=None for the full response (facets, tabs, counts).
+    
+    Responses are memoized for a few minutes; call
+    glean_search_raw.cache_clear() to force fresh requests.
+    """
+    if not GLEAN_API_TOKEN:
+        raise RuntimeError("GLEAN_API_TOKEN not set")
+    
+    key = _search_memo_key(
+        query, datasources, num_results, facet_filters, max_snippet_size, cursor, response_hints
+    )
     
     if debug:
-        print("\n" + "="*60)
-        print("GLEAN API REQUEST")
-        print("="*60)
+        print_banner("GLEAN API REQUEST")
         print(f"URL: {get_glean_api_url()}")
         print(f"Query: {query}")
         print(f"Datasources: {datasources}")
         print(f"Facet Filters: {json.dumps(facet_filters, indent=2) if facet_filters else 'None'}")
-        print("="*60 + "\n")
+        print(_BANNER + "\n")
+    
+    cached = _memo_get(key)
+    if cached is not None:
+        if debug:
+            print("(cached response)\n")
+        return cached
     
-    with httpx.Client(timeout=30.0) as client:
-        response = client.post(get_glean_api_url(), headers=headers, json=payload)
-        response.raise_for_status()
-        return response.json()
+    payload = _build_search_payload(
+        query, datasources, num_results, facet_filters, max_snippet_size, cursor, response_hints
+    )
+    response = _get_http_client().post(get_glean_api_url(), content=_json_body(payload), headers=_JSON_HEADERS)
+    response.raise_for_status()
+    
+    result = _json_loads(response.content)
+    _memo_set(key, result)
+    return result
+
+
+glean_search_raw.cache_clear = _memo_clear
+
+
+def iter_glean_search(
+    query: str,
+    datasources: Optional[list[str]] = None,
+    page_size: int = 5,
+    facet_filters: Optional[list[dict]] = None,
+    max_results: Optional[int] = None,
+    debug: bool = False,
+    max_snippet_size: int = 512
+):
+    """
+    Yield search results page by page, fetching the next page only when needed.
+    
+    Stops after `max_results` results, or when Glean reports no more.
+    """
+    if max_results is not None:
+        page_size = min(page_size, max_results)
+    
+    # The page size stays fixed across pages; Glean's cursor assumes it
+    cursor = None
+    yielded = 0
+    while True:
+        response = glean_search_raw(
+            query=query,
+            datasources=datasources,
+            num_results=page_size,
+            facet_filters=facet_filters,
+            debug=debug and cursor is None,
+            max_snippet_size=max_snippet_size,
+            cursor=cursor
+        )
+        
+        for result in response.get("results", []):
+            yield result
+            yielded += 1
+            if max_results is not None and yielded >= max_results:
+                return
+        
+        cursor = response.get("cursor")
+        if not cursor or not response.get("hasMoreResults"):
+            return
+
+
+async def glean_search_raw_async(
+    client: httpx.AsyncClient,
+    query: str,
+    datasources: Optional[list[str]] = None,
+    num_results: int = 10,
+    facet_filters: Optional[list[dict]] = None,
+    max_snippet_size: int = 512,
+    response_hints: Optional[tuple[str, ...]] = RESULTS_ONLY
+) -> dict:
+    """Async glean_search_raw (no debug banner) for running searches concurrently."""
+    if not GLEAN_API_TOKEN:
+        raise RuntimeError("GLEAN_API_TOKEN not set")
+    
+    key = _search_memo_key(
+        query, datasources, num_results, facet_filters, max_snippet_size, response_hints=response_hints
+    )
+    cached = _memo_get(key)
+    if cached is not None:
+        return cached
+    
+    payload = _build_search_payload(
+        query, datasources, num_results, facet_filters, max_snippet_size, response_hints=response_hints
+    )
+    response = await client.post(get_glean_api_url(), content=_json_body(payload), headers=_JSON_HEADERS)
+    response.raise_for_status()
+    
+    result = _json_loads(response.content)
+    _memo_set(key, result)
+    return result
+
+
+def _async_client() -> httpx.AsyncClient:
+    """
+    Create an async Glean client for one batch of searches.
+    
+    It cannot be shared like the sync client - each _run_async() call gets
+    a fresh event loop.
+    """
+    return httpx.AsyncClient(
+        timeout=30.0,
+        transport=httpx.AsyncHTTPTransport(retries=_CONNECT_RETRIES, http2=h2 is not None),
+        headers=_AUTH_HEADERS,
+    )
+
+
+def _run_async(coro) -> Any:
+    """
+    Run a coroutine to completion from sync code.
+    
+    Jupyter and Databricks notebooks already have an event loop running,
+    where asyncio.run() raises RuntimeError; there the coroutine runs on a
+    worker thread with its own loop.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+def _gather_searches(searches: list[dict]) -> list:
+    """
+    Run several searches concurrently and return their responses in order.
+    
+    Each item holds glean_search_raw_async keyword arguments. A failed
+    search yields its exception in place of a response.
+    """
+    async def run() -> list:
+        async with _async_client() as client:
+            return await asyncio.gather(
+                *(glean_search_raw_async(client, **search) for search in searches),
+                return_exceptions=True,
+            )
+    
+    return _run_async(run())
+
+
+def _search_until(searches: list[dict], enough: int) -> dict:
+    """
+    Run searches concurrently, stopping once `enough` of them return results.
+    
+    Returns {index: response or exception} for the searches that finished;
+    the rest are cancelled.
+    """
+    async def run() -> dict:
+        async with _async_client() as client:
+            async def probe(index: int, search: dict) -> tuple:
+                try:
+                    return index, await glean_search_raw_async(client, **search)
+                except Exception as e:
+                    return index, e
+            
+            tasks = [asyncio.create_task(probe(i, search)) for i, search in enumerate(searches)]
+            finished = {}
+            hits = 0
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    index, response = await next_done
+                    finished[index] = response
+                    if not isinstance(response, Exception) and response.get("results"):
+                        hits += 1
+                        if hits >= enough:
+                            break
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+            return finished
+    
+    return _run_async(run())
+
+
+def glean_multi_search(searches: list[dict], concurrency: bool = True) -> list:
+    """
+    Run a batch of searches and return their responses in order.
+    
+    Glean has no multi-search endpoint, so the batch is emulated: with
+    `concurrency` the searches go out together over one pooled client,
+    otherwise one after another (handy when comparing timings). Each item
+    holds glean_search_raw keyword arguments (without `debug`); a failed
+    search yields its exception in place of a response.
+    """
+    if concurrency:
+        return _gather_searches(searches)
+    
+    responses = []
+    for search in searches:
+        try:
+            responses.append(glean_search_raw(**search))
+        except Exception as e:
+            responses.append(e)
+    return responses
 
 
 # =============================================================================
 # RESULT FORMATTING
 # =============================================================================
 
+_BANNER = "=" * 60
+
+
+def print_banner(title: str) -> None:
+    """Print a section title between banner lines, preceded by a blank line."""
+    sys.stdout.write(f"\n{_BANNER}\n{title}\n{_BANNER}\n")
+
+
+def _json_dumps_indented(value) -> str:
+    """json.dumps(value, indent=2, default=str), via orjson when installed."""
+    if orjson:
+        return orjson.dumps(value, default=str, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(value, indent=2, default=str)
+
+
+def _json_preview(data: dict, limit: int = 1000) -> str:
+    """
+    Pretty-print a dict as indented JSON, cut to `limit` chars.
+    
+    Values are serialized one at a time and the rest skipped once the
+    limit is reached, so a large response is never dumped in full.
+    """
+    if not data:
+        return "{}"
+    
+    parts = []
+    size = 2
+    for key, value in data.items():
+        part = f"  {json.dumps(str(key))}: " + _json_dumps_indented(value).replace("\n", "\n  ")
+        parts.append(part)
+        size += len(part) + 2
+        if size > limit:
+            break
+    
+    return ("{\n" + ",\n".join(parts) + "\n}")[:limit]
+
+
 def format_result_simple(result: dict, index: int) -> str:
     """Format a single result for display."""
     doc = result.get("document", {})
@@ -122,97 +557,132 @@ def format_result_simple(result: dict, index: int) -> str:
 """
 
 
+_PUNCTUATION_RE = re.compile(r"[^\w\s]+")
+
+
+def _title_signature(doc: dict) -> Optional[tuple]:
+    """(datasource, normalized title) - catches near-duplicate records."""
+    title = doc.get("title")
+    if not title:
+        return None
+    return doc.get("datasource"), " ".join(_PUNCTUATION_RE.sub(" ", title).casefold().split())
+
+
+def print_results(results: list[dict]) -> None:
+    """Print the RESULTS block in one write rather than a print per result."""
+    parts = ["\nRESULTS:\n"]
+    parts.extend(format_result_simple(r, i) + "\n" for i, r in enumerate(results, 1))
+    sys.stdout.write("".join(parts))
+
+
 def analyze_results(results: list[dict], target_account: str = None) -> None:
     """Analyze results for relevance."""
-    print("\n" + "="*60)
-    print("RESULTS ANALYSIS")
-    print("="*60)
+    lines = ["", _BANNER, "RESULTS ANALYSIS", _BANNER]
     
     if not results:
-        print("❌ No results found")
+        lines.append("❌ No results found")
+        sys.stdout.write("\n".join(lines) + "\n")
         return
     
-    print(f"Total results: {len(results)}")
+    lines.append(f"Total results: {len(results)}")
     
-    # Check if target account is in results
-    if target_account:
-        matching = 0
-        non_matching = []
+    # One pass: tally datasources and check titles for the target account
+    target = target_account.lower() if target_account else None
+    datasources = Counter()
+    matching = 0
+    non_matching = []
+    
+    for r in results:
+        doc = r.get("document", {})
+        datasources[doc.get("datasource", "unknown")] += 1
         
-        for r in results:
-            doc = r.get("document", {})
-            title = doc.get("title", "").lower()
-            
-            if target_account.lower() in title:
+        if target is not None:
+            title = doc.get("title")
+            if title is not None and target in title.lower():
                 matching += 1
             else:
-                non_matching.append(doc.get("title", "Untitled"))
-        
-        print(f"\n✅ Results matching '{target_account}': {matching}/{len(results)}")
+                non_matching.append("Untitled" if title is None else title)
+    
+    if target_account:
+        lines.append(f"\n✅ Results matching '{target_account}': {matching}/{len(results)}")
         
         if non_matching:
-            print(f"⚠️  Non-matching results:")
-            for title in non_matching[:5]:
-                print(f"   - {title}")
+            lines.append(f"⚠️  Non-matching results:")
+            lines.extend(f"   - {title}" for title in non_matching[:5])
     
     # Show datasource breakdown
-    datasources = {}
-    for r in results:
-        ds = r.get("document", {}).get("datasource", "unknown")
-        datasources[ds] = datasources.get(ds, 0) + 1
+    lines.append(f"\nDatasource breakdown:")
+    lines.extend(f"   {ds}: {count}" for ds, count in datasources.items())
     
-    print(f"\nDatasource breakdown:")
-    for ds, count in datasources.items():
-        print(f"   {ds}: {count}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # =============================================================================
 # QUERY OPTIMIZATION
 # =============================================================================
 
+# Words that mark the end of the account name in a query ("AdventHealth renewal")
+_ACTION_WORDS = frozenset({
+    'renewal', 'renew', 'contract', 'opportunity', 'deal',
+    'contact', 'contacts', 'stakeholder', 'decision',
+    'account', 'company', 'info', 'overview',
+    'call', 'calls', 'meeting', 'email', 'slack',
+    'qbr', 'ebr', 'plan', 'strategy', 'doc',
+    'metric', 'metrics', 'dashboard', 'spend', 'funding',
+    'key', 'recent', 'last', 'latest', 'upcoming',
+})
+
+# Whole whitespace-delimited action word candidates, in one regex scan.
+# Unicode IGNORECASE also matches e.g. 'ſlack', so candidates are confirmed
+# with str.lower() - see _first_action_word
+_ACTION_RE = re.compile(
+    r'(?<!\S)(?:' + '|'.join(map(re.escape, sorted(_ACTION_WORDS, key=len, reverse=True))) + r')(?!\S)',
+    re.IGNORECASE
+)
+
+
+def _first_action_word(query: str) -> Optional[re.Match]:
+    """First word of `query` whose lower() is an action word, or None."""
+    return next((m for m in _ACTION_RE.finditer(query) if m.group().lower() in _ACTION_WORDS), None)
+
+
+@lru_cache(maxsize=1024)  # pure; the same account queries repeat a lot
 def quote_account_name(query: str) -> str:
     """
     Quote the account name in a query to prevent Glean from returning unrelated results.
     
     Assumes account name is at the START of the query.
     """
-    if query.startswith('"'):
+    if query.lstrip().startswith('"'):
         return query
     
-    action_words = [
-        'renewal', 'renew', 'contract', 'opportunity', 'deal',
-        'contact', 'contacts', 'stakeholder', 'decision',
-        'account', 'company', 'info', 'overview',
-        'call', 'calls', 'meeting', 'email', 'slack',
-        'qbr', 'ebr', 'plan', 'strategy', 'doc',
-        'metric', 'metrics', 'dashboard', 'spend', 'funding',
-        'key', 'recent', 'last', 'latest', 'upcoming'
-    ]
-    
-    words = query.split()
-    account_words = []
-    rest_words = []
-    found_action = False
+    # Everything before the first action word is the account name
+    match = _first_action_word(query)
+    split = match.start() if match else len(query)
     
-    for word in words:
-        if not found_action and word.lower() not in action_words:
-            account_words.append(word)
-        else:
-            found_action = True
-            rest_words.append(word)
-    
-    if account_words:
-        account_name = ' '.join(account_words)
-        rest = ' '.join(rest_words)
-        return f'"{account_name}" {rest}'.strip()
+    account_name = ' '.join(query[:split].split())
+    if not account_name:
+        return query
     
-    return query
+    rest = ' '.join(query[split:].split())
+    return f'"{account_name}" {rest}'.strip()
 
 
 # =============================================================================
 # TOOL FUNCTIONS TO TEST
 # =============================================================================
 
+def _type_filter(doc_type: str) -> list[dict]:
+    """Build a facet filter restricting results to one document type."""
+    return to_filter_list(FacetFilter("type", doc_type))
+
+
+# Same filters as the agent tools, built once and shared by every test
+_OPPORTUNITY_FILTER = _type_filter("opportunity")
+_ACCOUNT_FILTER = _type_filter("account")
+_CONTACT_FILTER = _type_filter("contact")
+
+
 def test_salesforce_opportunities(query: str, target_account: str = None, use_auto_quote: bool = True) -> None:
     """
     Test Salesforce Opportunities search.
@@ -228,22 +698,19 @@ def test_salesforce_opportunities(query: str, target_account: str = None, use_au
             print(f"   📝 Auto-quoted: {query} → {optimized_query}")
         query = optimized_query
     
-    facet_filters = [
-        {"fieldName": "type", "values": [{"value": "opportunity", "relationType": "EQUALS"}]}
-    ]
+    facet_filters = _OPPORTUNITY_FILTER
     
     response = glean_search_raw(
         query=query,
         datasources=["salescloud"],
         num_results=5,
-        facet_filters=facet_filters
+        facet_filters=facet_filters,
+        debug=True
     )
     
     results = response.get("results", [])
     
-    print("\nRESULTS:")
-    for i, r in enumerate(results, 1):
-        print(format_result_simple(r, i))
+    print_results(results)
     
     analyze_results(results, target_account or query.split()[0])
 
@@ -252,22 +719,19 @@ def test_salesforce_accounts(query: str, target_account: str = None) -> None:
     """Test Salesforce Accounts search."""
     print("\n" + "🔍 TESTING: search_salesforce_accounts")
     
-    facet_filters = [
-        {"fieldName": "type", "values": [{"value": "account", "relationType": "EQUALS"}]}
-    ]
+    facet_filters = _ACCOUNT_FILTER
     
     response = glean_search_raw(
         query=query,
         datasources=["salescloud"],
         num_results=5,
-        facet_filters=facet_filters
+        facet_filters=facet_filters,
+        debug=True
     )
     
     results = response.get("results", [])
     
-    print("\nRESULTS:")
-    for i, r in enumerate(results, 1):
-        print(format_result_simple(r, i))
+    print_results(results)
     
     analyze_results(results, target_account or query.split()[0])
 
@@ -276,22 +740,19 @@ def test_salesforce_contacts(query: str, target_account: str = None) -> None:
     """Test Salesforce Contacts search."""
     print("\n" + "🔍 TESTING: search_salesforce_contacts")
     
-    facet_filters = [
-        {"fieldName": "type", "values": [{"value": "contact", "relationType": "EQUALS"}]}
-    ]
+    facet_filters = _CONTACT_FILTER
     
     response = glean_search_raw(
         query=query,
         datasources=["salescloud"],
         num_results=5,
-        facet_filters=facet_filters
+        facet_filters=facet_filters,
+        debug=True
     )
     
     results = response.get("results", [])
     
-    print("\nRESULTS:")
-    for i, r in enumerate(results, 1):
-        print(format_result_simple(r, i))
+    print_results(results)
     
     analyze_results(results, target_account or query.split()[0])
 
@@ -303,14 +764,13 @@ def test_communications(query: str, target_account: str = None) -> None:
     response = glean_search_raw(
         query=query,
         datasources=["gong", "slack", "gmail"],
-        num_results=9
+        num_results=9,
+        debug=True
     )
     
     results = response.get("results", [])
     
-    print("\nRESULTS:")
-    for i, r in enumerate(results, 1):
-        print(format_result_simple(r, i))
+    print_results(results)
     
     analyze_results(results, target_account or query.split()[0])
 
@@ -322,14 +782,13 @@ def test_strategy_docs(query: str, target_account: str = None) -> None:
     response = glean_search_raw(
         query=query,
         datasources=["gdrive"],
-        num_results=5
+        num_results=5,
+        debug=True
     )
     
     results = response.get("results", [])
     
-    print("\nRESULTS:")
-    for i, r in enumerate(results, 1):
-        print(format_result_simple(r, i))
+    print_results(results)
     
     analyze_results(results, target_account or query.split()[0])
 
@@ -341,14 +800,13 @@ def test_metrics(query: str, target_account: str = None) -> None:
     response = glean_search_raw(
         query=query,
         datasources=["salescloud", "looker"],
-        num_results=6
+        num_results=6,
+        debug=True
     )
     
     results = response.get("results", [])
     
-    print("\nRESULTS:")
-    for i, r in enumerate(results, 1):
-        print(format_result_simple(r, i))
+    print_results(results)
     
     analyze_results(results, target_account or query.split()[0])
 
@@ -357,44 +815,155 @@ def test_metrics(query: str, target_account: str = None) -> None:
 # EXPERIMENTAL: STRICTER FILTERING
 # =============================================================================
 
-def test_strict_opportunity_search(account_name: str) -> None:
+def test_strict_opportunity_search(account_name: str, compare_variants: bool = False) -> None:
     """
     EXPERIMENTAL: Try stricter filtering for opportunities.
     
-    Test different query patterns to get ONLY the target account's opportunities.
+    The renewal patterns share the quoted account name, so they go out as
+    one combined query; `"renewal date"` is covered by `renewal`. The bare
+    account name goes out alongside it as one batch, so opportunities that
+    never mention renewal still show up. Results are merged and ranked
+    client-side. Pass `compare_variants` to run each pattern separately
+    and compare them.
     """
     print(f"\n🧪 EXPERIMENTAL: Strict opportunity search for '{account_name}'")
     
-    # Test 1: Quoted account name
-    print("\n--- Test 1: Quoted account name ---")
-    test_salesforce_opportunities(f'"{account_name}" renewal', account_name)
+    if compare_variants:
+        _compare_opportunity_variants(account_name)
+        return
+    
+    queries = [f'"{account_name}" renewal', f'"{account_name}"']
+    print(f"   Queries: {' | '.join(queries)}")
+    
+    responses = glean_multi_search([
+        {"query": query, "datasources": ["salescloud"], "num_results": 15, "facet_filters": _OPPORTUNITY_FILTER}
+        for query in queries
+    ])
+    
+    # Renewal hits first, then the bare-account ones they didn't already cover
+    results = []
+    seen = set()
+    for query, response in zip(queries, responses):
+        if isinstance(response, Exception):
+            print(f"   ❌ Error ({query}): {response}")
+            continue
+        for result in response.get("results", []):
+            doc = result.get("document", {})
+            key = doc.get("id") or doc.get("url") or doc.get("title")
+            if key not in seen:
+                seen.add(key)
+                results.append(result)
+    
+    # Titles naming the account first, then renewal-related ones
+    account = account_name.casefold()
+    
+    def rank(result: dict) -> tuple:
+        title = (result.get("document", {}).get("title") or "").casefold()
+        return account not in title, "renewal" not in title
+    
+    # Stable sort - ties keep the renewal query's order
+    results.sort(key=rank)
+    
+    print_results(results[:5])
+    
+    analyze_results(results, account_name)
+
+
+def _compare_opportunity_variants(account_name: str) -> None:
+    """Run each strict opportunity query pattern separately and print them side by side."""
+    variants = [
+        ("Test 1: Quoted account name", f'"{account_name}" renewal'),
+        ("Test 2: Account first, then action", f'{account_name} renewal date'),
+        ("Test 3: Just account name", account_name),
+    ]
+    queries = [quote_account_name(query) for _, query in variants]
+    
+    facet_filters = _OPPORTUNITY_FILTER
     
-    # Test 2: Account name + type filter
-    print("\n--- Test 2: Account first, then action ---")
-    test_salesforce_opportunities(f'{account_name} renewal date', account_name)
+    # The three variants are independent - send them as one batch
+    responses = glean_multi_search([
+        {"query": query, "datasources": ["salescloud"], "num_results": 5, "facet_filters": facet_filters}
+        for query in queries
+    ])
     
-    # Test 3: Just account name
-    print("\n--- Test 3: Just account name ---")
-    test_salesforce_opportunities(account_name, account_name)
+    for (label, original), query, response in zip(variants, queries, responses):
+        print(f"\n--- {label} ---")
+        print(f"   Query: {query}")
+        if query != original:
+            print(f"   📝 Auto-quoted: {original} → {query}")
+        
+        if isinstance(response, Exception):
+            print(f"   ❌ Error: {response}")
+            continue
+        
+        results = response.get("results", [])
+        
+        print_results(results)
+        
+        analyze_results(results, account_name)
+
+
+# Facet names Salesforce account fields have shown up under
+_ACCOUNT_FACET_CANDIDATES = frozenset({"accountname", "account", "account_name"})
+
+
+# Match-all discovery responses by datasource (None = unfiltered). Facets and
+# result tabs rarely change, so these live for the whole session.
+def _discovery_request(datasource: Optional[str]) -> dict:
+    """Keyword arguments for the match-all search used for discovery."""
+    return {
+        "query": "*",
+        "datasources": [datasource] if datasource else None,
+        "num_results": 1,
+        "response_hints": None,
+    }
+
+
+def _discovery_search(datasource: Optional[str]) -> dict:
+    """Match-all search used for discovery, memoized like any other search."""
+    return glean_search_raw(**_discovery_request(datasource))
 
 
-def test_with_post_filtering(query: str, account_name: str) -> None:
+def _fetch_facets(datasource: str) -> list[dict]:
+    """Facet results for a datasource."""
+    return _discovery_search(datasource).get("facetResults", [])
+
+
+def find_account_facet(datasource: str = "salescloud") -> Optional[str]:
+    """Return the facet field that holds the account name, if the datasource has one."""
+    for facet in _fetch_facets(datasource):
+        name = facet.get("sourceName")
+        if name and name.casefold() in _ACCOUNT_FACET_CANDIDATES:
+            return name
+    return None
+
+
+def test_with_post_filtering(query: str, account_name: str, account_facet: Optional[str] = None) -> None:
     """
     EXPERIMENTAL: Test with post-result filtering.
     
-    After getting results, filter to only those containing the account name.
+    The account is filtered server-side when salescloud exposes an account
+    facet (`account_facet`, or discovered automatically). Results are then
+    filtered to only those containing the account name - with the facet in
+    place this is just a check, otherwise it does the filtering.
     """
     print(f"\n🧪 EXPERIMENTAL: Post-filtering for '{account_name}'")
     
-    facet_filters = [
-        {"fieldName": "type", "values": [{"value": "opportunity", "relationType": "EQUALS"}]}
-    ]
+    account_facet = account_facet or find_account_facet("salescloud")
+    if account_facet:
+        print(f"   Filtering server-side on facet '{account_facet}'")
+        facet_filters = to_filter_list(FacetFilter("type", "opportunity"), FacetFilter(account_facet, account_name))
+    else:
+        print("   No account facet found - filtering client-side only")
+        facet_filters = _OPPORTUNITY_FILTER
     
     response = glean_search_raw(
         query=query,
         datasources=["salescloud"],
         num_results=10,  # Get more, filter down
-        facet_filters=facet_filters
+        facet_filters=facet_filters,
+        max_snippet_size=4000,  # Post-filter scans the content for the account
+        debug=True
     )
     
     results = response.get("results", [])
@@ -402,21 +971,42 @@ def test_with_post_filtering(query: str, account_name: str) -> None:
     # Post-filter: only keep results with account name in title
     filtered = []
     rejected = []
+    duplicates = 0
+    seen_ids = set()
+    seen_signatures = set()
+    needle = account_name.casefold()
     
     for r in results:
         doc = r.get("document", {})
-        title = doc.get("title", "").lower()
-        content = str(r.get("llmContent", "")).lower() + str(r.get("snippets", "")).lower()
+        title = doc.get("title")
+        # One scan over title + content; the separator stops a match spanning both
+        haystack = "\x00".join((
+            title or "",
+            str(r.get("llmContent", "")),
+            str(r.get("snippets", "")),
+        )).casefold()
         
-        if account_name.lower() in title or account_name.lower() in content:
-            filtered.append(r)
-        else:
-            rejected.append(doc.get("title", "Untitled"))
+        display_title = "Untitled" if title is None else title
+        if needle not in haystack:
+            rejected.append(display_title)
+            continue
+        
+        # Glean can return the same record (or a near-copy) more than once
+        doc_id = doc.get("id") or doc.get("url") or title
+        signature = _title_signature(doc)
+        if (doc_id is not None and doc_id in seen_ids) or (signature is not None and signature in seen_signatures):
+            duplicates += 1
+            continue
+        seen_ids.add(doc_id)
+        seen_signatures.add(signature)
+        
+        filtered.append(display_title)
     
     print(f"\n📊 POST-FILTER RESULTS:")
     print(f"   Original: {len(results)} results")
     print(f"   Filtered: {len(filtered)} results")
     print(f"   Rejected: {len(rejected)} results")
+    print(f"   Duplicates dropped: {duplicates}")
     
     if rejected:
         print(f"\n   ❌ Rejected (no '{account_name}' in title/content):")
@@ -424,16 +1014,13 @@ def test_with_post_filtering(query: str, account_name: str) -> None:
             print(f"      - {title}")
     
     print(f"\n   ✅ Kept:")
-    for i, r in enumerate(filtered[:5], 1):
-        doc = r.get("document", {})
-        print(f"      [{i}] {doc.get('title', 'Untitled')}")
+    for i, title in enumerate(filtered[:5], 1):
+        print(f"      [{i}] {title}")
 
 
 def test_quoted_jpmc() -> None:
     """Test if quoting JPMC helps with filtering."""
-    print("\n" + "="*60)
-    print("TEST: Quoted JPMC vs Unquoted")
-    print("="*60)
+    print_banner("TEST: Quoted JPMC vs Unquoted")
     
     print("\n--- Unquoted (no auto-quote) ---")
     test_salesforce_opportunities("JPMorgan Chase renewal", "JPMorgan", use_auto_quote=False)
@@ -444,9 +1031,7 @@ def test_quoted_jpmc() -> None:
 
 def test_auto_quoting() -> None:
     """Test the automatic quoting function."""
-    print("\n" + "="*60)
-    print("TEST: Auto-quoting function")
-    print("="*60)
+    print_banner("TEST: Auto-quoting function")
     
     test_cases = [
         "JPMorgan Chase renewal",
@@ -461,6 +1046,21 @@ def test_auto_quoting() -> None:
         print(f"  {query:40} → {result}")
 
 
+# Fields that might reveal permission filtering, in the order they are reported
+_RESPONSE_PERMISSION_FIELDS = (
+    'hasMoreResults', 'restrictedResults', 'filteredResults',
+    'accessDenied', 'permissionDenied', 'hiddenResults',
+    'totalResults', 'estimatedTotalResults', 'filteredCount',
+    'metadata', 'searchMetadata', 'debugInfo'
+)
+_DOC_PERMISSION_FIELDS = (
+    'permissions', 'access', 'viewPermissions', 'restricted',
+    'visibility', 'accessLevel', 'userCanView'
+)
+_RESPONSE_PERMISSION_FIELD_SET = frozenset(_RESPONSE_PERMISSION_FIELDS)
+_DOC_PERMISSION_FIELD_SET = frozenset(_DOC_PERMISSION_FIELDS)
+
+
 def inspect_full_response(query: str, datasource: str = "salescloud") -> None:
     """
     Inspect the FULL Glean API response to find permission-related fields.
@@ -472,24 +1072,27 @@ def inspect_full_response(query: str, datasource: str = "salescloud") -> None:
     - Any other metadata about access
     """
     print(f"\n🔬 INSPECTING FULL RESPONSE STRUCTURE")
-    print("="*60)
+    print(_BANNER)
     
-    facet_filters = [
-        {"fieldName": "type", "values": [{"value": "opportunity", "relationType": "EQUALS"}]}
-    ]
+    facet_filters = _OPPORTUNITY_FILTER
     
     response = glean_search_raw(
         query=query,
         datasources=[datasource],
         num_results=3,
         facet_filters=facet_filters,
-        debug=False
+        debug=False,
+        max_snippet_size=4000,
+        response_hints=None  # the whole point is to see everything Glean sends
     )
     
-    # Print all top-level keys
+    # Print all top-level keys, picking out permission fields on the way
     print(f"\n📋 TOP-LEVEL RESPONSE KEYS:")
-    for key in response.keys():
-        value = response[key]
+    permission_values = {}
+    for key, value in response.items():
+        if key in _RESPONSE_PERMISSION_FIELD_SET:
+            permission_values[key] = value
+        
         if isinstance(value, list):
             print(f"   {key}: list[{len(value)}]")
         elif isinstance(value, dict):
@@ -498,17 +1101,10 @@ def inspect_full_response(query: str, datasource: str = "salescloud") -> None:
             print(f"   {key}: {type(value).__name__} = {str(value)[:50]}")
     
     # Check for permission-related fields
-    permission_fields = [
-        'hasMoreResults', 'restrictedResults', 'filteredResults',
-        'accessDenied', 'permissionDenied', 'hiddenResults',
-        'totalResults', 'estimatedTotalResults', 'filteredCount',
-        'metadata', 'searchMetadata', 'debugInfo'
-    ]
-    
     print(f"\n🔐 PERMISSION-RELATED FIELDS:")
-    for field in permission_fields:
-        if field in response:
-            print(f"   ✅ {field}: {response[field]}")
+    for field in _RESPONSE_PERMISSION_FIELDS:
+        if field in permission_values:
+            print(f"   ✅ {field}: {permission_values[field]}")
         else:
             print(f"   ❌ {field}: not present")
     
@@ -517,8 +1113,7 @@ def inspect_full_response(query: str, datasource: str = "salescloud") -> None:
     if results:
         print(f"\n📄 FIRST RESULT STRUCTURE:")
         first = results[0]
-        for key in first.keys():
-            value = first[key]
+        for key, value in first.items():
             if isinstance(value, dict):
                 print(f"   {key}: dict with keys {list(value.keys())[:8]}")
             elif isinstance(value, list):
@@ -529,24 +1124,23 @@ def inspect_full_response(query: str, datasource: str = "salescloud") -> None:
         # Check document metadata
         doc = first.get("document", {})
         print(f"\n📁 DOCUMENT METADATA KEYS:")
-        for key in doc.keys():
+        doc_permission_values = {}
+        for key, value in doc.items():
             print(f"   {key}")
+            if key in _DOC_PERMISSION_FIELD_SET:
+                doc_permission_values[key] = value
         
         # Check for permission fields in document
-        doc_permission_fields = [
-            'permissions', 'access', 'viewPermissions', 'restricted',
-            'visibility', 'accessLevel', 'userCanView'
-        ]
         print(f"\n🔐 DOCUMENT PERMISSION FIELDS:")
-        for field in doc_permission_fields:
-            if field in doc:
-                print(f"   ✅ {field}: {doc[field]}")
+        for field in _DOC_PERMISSION_FIELDS:
+            if field in doc_permission_values:
+                print(f"   ✅ {field}: {doc_permission_values[field]}")
     
     # Print raw JSON of interesting fields
     print(f"\n📦 RAW RESPONSE (relevant sections):")
     interesting = {k: v for k, v in response.items() if k not in ['results', 'facetResults']}
     if interesting:
-        print(json.dumps(interesting, indent=2, default=str)[:1000])
+        print(_json_preview(interesting))
     else:
         print("   No additional metadata fields found")
 
@@ -557,14 +1151,7 @@ def discover_available_facets(datasource: str = "salescloud") -> None:
     """
     print(f"\n🔎 Discovering facets for: {datasource}")
     
-    response = glean_search_raw(
-        query="*",
-        datasources=[datasource],
-        num_results=1,
-        debug=False
-    )
-    
-    facets = response.get("facetResults", [])
+    facets = _fetch_facets(datasource)
     
     print(f"\nAvailable facets ({len(facets)}):")
     for facet in facets:
@@ -583,16 +1170,17 @@ def discover_available_facets(datasource: str = "salescloud") -> None:
 # PEOPLE SEARCH TESTING
 # =============================================================================
 
-def test_people_search(query: str = "Tracy Platt") -> None:
+def test_people_search(query: str = "Tracy Platt", stop_after: Optional[int] = 1) -> None:
     """
     Test people directory search with different datasource names.
     
     Glean's people directory might use different datasource names depending
     on where the data is synced from (Workday, BambooHR, etc.).
+    
+    Probing stops once `stop_after` datasources return results; pass None
+    to probe every name and always run the unfiltered search as well.
     """
-    print("\n" + "="*60)
-    print(f"TESTING: People Search for '{query}'")
-    print("="*60)
+    print_banner(f"TESTING: People Search for '{query}'")
     
     # Common datasource names for people directories
     datasource_options = [
@@ -607,61 +1195,62 @@ def test_people_search(query: str = "Tracy Platt") -> None:
     
     working_datasources = []
     
-    for ds in datasource_options:
+    # All probes are independent - run them at once, then print in order
+    probes = [{"query": query, "datasources": [ds], "num_results": 3} for ds in datasource_options]
+    if stop_after is None:
+        responses = dict(enumerate(glean_multi_search(probes)))
+    else:
+        responses = _search_until(probes, stop_after)
+    
+    for i, ds in enumerate(datasource_options):
         print(f"\n--- Testing datasource: '{ds}' ---")
+        if i not in responses:
+            print("   ⏭️  Skipped (enough matches found)")
+            continue
+        
+        response = responses[i]
         try:
-            response = glean_search_raw(
-                query=query,
-                datasources=[ds],
-                num_results=3,
-                debug=False
-            )
+            if isinstance(response, Exception):
+                raise response
             results = response.get("results", [])
             print(f"   Results: {len(results)}")
             
             if results:
                 working_datasources.append(ds)
-                for i, r in enumerate(results[:2], 1):
+                for j, r in enumerate(results[:2], 1):
                     doc = r.get("document", {})
                     title = doc.get("title", "Untitled")
                     url = doc.get("url", "")
-                    print(f"   [{i}] {title}")
+                    print(f"   [{j}] {title}")
                     print(f"       URL: {url[:80]}...")
         except Exception as e:
             print(f"   ❌ Error: {e}")
     
     # Also try without datasource filter (general search)
     print(f"\n--- Testing: No datasource filter (general) ---")
-    try:
-        response = glean_search_raw(
-            query=query,
-            datasources=None,
-            num_results=5,
-            debug=False
-        )
-        results = response.get("results", [])
-        print(f"   Results: {len(results)}")
-        
-        # Show what datasources appear in results
-        datasources_found = {}
-        for r in results:
-            ds = r.get("document", {}).get("datasource", "unknown")
-            datasources_found[ds] = datasources_found.get(ds, 0) + 1
-        
-        print(f"   Datasources in results: {datasources_found}")
-        
-        for i, r in enumerate(results[:3], 1):
-            doc = r.get("document", {})
-            title = doc.get("title", "Untitled")
-            ds = doc.get("datasource", "?")
-            print(f"   [{i}] ({ds}) {title}")
-    except Exception as e:
-        print(f"   ❌ Error: {e}")
+    if working_datasources and stop_after is not None:
+        print("   ⏭️  Skipped (a people datasource already matched)")
+    else:
+        try:
+            response = glean_search_raw(query=query, datasources=None, num_results=5)
+            results = response.get("results", [])
+            print(f"   Results: {len(results)}")
+            
+            # Show what datasources appear in results
+            docs = [r.get("document", {}) for r in results]
+            datasources_found = dict(Counter(doc.get("datasource", "unknown") for doc in docs))
+            
+            print(f"   Datasources in results: {datasources_found}")
+            
+            for i, doc in enumerate(docs[:3], 1):
+                title = doc.get("title", "Untitled")
+                ds = doc.get("datasource", "?")
+                print(f"   [{i}] ({ds}) {title}")
+        except Exception as e:
+            print(f"   ❌ Error: {e}")
     
     # Summary
-    print("\n" + "="*60)
-    print("SUMMARY")
-    print("="*60)
+    print_banner("SUMMARY")
     if working_datasources:
         print(f"✅ Working datasources: {working_datasources}")
         print(f"   Recommended: Use '{working_datasources[0]}' in search_people()")
@@ -674,17 +1263,10 @@ def discover_people_datasource() -> None:
     """
     Try to discover what datasources are available for people search.
     """
-    print("\n" + "="*60)
-    print("DISCOVERING: Available datasources in Glean")
-    print("="*60)
+    print_banner("DISCOVERING: Available datasources in Glean")
     
     # Search for a common name to see what datasources return results
-    response = glean_search_raw(
-        query="*",
-        datasources=None,
-        num_results=1,
-        debug=False
-    )
+    response = _discovery_search(None)
     
     # Check resultTabs for available datasources
     result_tabs = response.get("resultTabs", [])
@@ -694,6 +1276,23 @@ def discover_people_datasource() -> None:
         print(f"   - {tab_id}")
 
 
+def discover_all(datasource: str = "salescloud") -> None:
+    """
+    Run facet and datasource discovery together.
+    
+    Both match-all probes go out as one batch; the discovery functions then
+    read them from the search memo.
+    """
+    probes = (datasource, None)
+    responses = glean_multi_search([_discovery_request(ds) for ds in probes])
+    for ds, response in zip(probes, responses):
+        if isinstance(response, Exception):
+            print(f"❌ Discovery search for {ds or 'all datasources'} failed: {response}")
+    
+    discover_available_facets(datasource)
+    discover_people_datasource()
+
+
 # =============================================================================
 # MAIN - Interactive Testing
 # =============================================================================
@@ -702,19 +1301,44 @@ def discover_people_datasource() -> None:
 # DATE FILTERING TESTS
 # =============================================================================
 
+@lru_cache(maxsize=32)
+def _date_window_on(days_back: int, today: date) -> tuple[str, str]:
+    """(start, end_exclusive) for the last `days_back` days as of `today`."""
+    return (today - timedelta(days=days_back)).isoformat(), (today + timedelta(days=1)).isoformat()
+
+
+def _date_window(days_back: int) -> tuple[str, str]:
+    """
+    Half-open date window covering the last `days_back` days, including today.
+    
+    The end is tomorrow, so the range reads start < updated < end_exclusive
+    rather than relying on a bucket keyword or cutting off today's documents.
+    """
+    return _date_window_on(days_back, date.today())
+
+
+def _date_range_filter(days_back: int) -> list[dict]:
+    """last_updated_at facet filter for the half-open window from _date_window."""
+    start, end_exclusive = _date_window(days_back)
+    return to_filter_list(
+        FacetFilter("last_updated_at", start, "GT"),
+        FacetFilter("last_updated_at", end_exclusive, "LT"),
+    )
+
+
+# Glean's date keywords, each with its filter built once
+_KEYWORD_FILTERS = {
+    keyword: to_filter_list(FacetFilter("last_updated_at", keyword))
+    for keyword in ("past_day", "past_week", "past_month", "today", "yesterday")
+}
+
+
 def test_date_filter_keywords() -> None:
     """Test Glean's special date filter keywords."""
-    print("\n" + "="*60)
-    print("TEST: Date Filter Keywords")
-    print("="*60)
+    print_banner("TEST: Date Filter Keywords")
     
-    keywords = ["past_day", "past_week", "past_month", "today", "yesterday"]
-    
-    for keyword in keywords:
+    for keyword, facet_filters in _KEYWORD_FILTERS.items():
         print(f"\n--- Testing: {keyword} ---")
-        facet_filters = [
-            {"fieldName": "last_updated_at", "values": [{"relationType": "EQUALS", "value": keyword}]}
-        ]
         
         response = glean_search_raw(
             query="AdventHealth",
@@ -737,27 +1361,14 @@ def test_date_filter_keywords() -> None:
 
 def test_date_filter_range() -> None:
     """Test Glean's date range filtering with GT/LT."""
-    print("\n" + "="*60)
-    print("TEST: Date Range Filter (GT/LT)")
-    print("="*60)
-    
-    from datetime import datetime, timedelta
+    print_banner("TEST: Date Range Filter (GT/LT)")
     
     # Last 30 days
-    end_date = datetime.now().strftime("%Y-%m-%d")
-    start_date = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
-    
-    print(f"\nSearching: {start_date} to {end_date}")
-    
-    facet_filters = [
-        {
-            "fieldName": "last_updated_at",
-            "values": [
-                {"relationType": "GT", "value": start_date},
-                {"relationType": "LT", "value": end_date}
-            ]
-        }
-    ]
+    start_date, end_date = _date_window(30)
+    
+    print(f"\nSearching: {start_date} to {end_date} (exclusive)")
+    
+    facet_filters = _date_range_filter(30)
     
     response = glean_search_raw(
         query="AdventHealth",
@@ -781,25 +1392,14 @@ def test_date_filter_range() -> None:
 
 def test_communications_time_filtered(account: str = "AdventHealth", days_back: int = 7) -> None:
     """Test searching recent communications with date filter."""
-    print("\n" + "="*60)
-    print(f"TEST: Recent Communications for {account} (last {days_back} days)")
-    print("="*60)
+    print_banner(f"TEST: Recent Communications for {account} (last {days_back} days)")
     
-    from datetime import datetime, timedelta
-    
-    start_date = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
-    
-    facet_filters = [
-        {
-            "fieldName": "last_updated_at",
-            "values": [{"relationType": "GT", "value": start_date}]
-        }
-    ]
+    facet_filters = _date_range_filter(days_back)
     
     response = glean_search_raw(
         query=f'"{account}" calls meetings',
         datasources=["gong", "slack", "gmail"],
-        num_results=10,
+        num_results=5,  # Only the first 5 are shown
         facet_filters=facet_filters,
         debug=False
     )
@@ -821,11 +1421,7 @@ def test_communications_time_filtered(account: str = "AdventHealth", days_back:
 
 def test_nlp_vs_filter_comparison(account: str = "AdventHealth") -> None:
     """Compare results: NLP time expression vs explicit date filter."""
-    print("\n" + "="*60)
-    print(f"TEST: NLP vs Date Filter Comparison for {account}")
-    print("="*60)
-    
-    from datetime import datetime, timedelta
+    print_banner(f"TEST: NLP vs Date Filter Comparison for {account}")
     
     # Method 1: NLP (let Glean interpret "last week")
     print("\n--- Method 1: NLP (query contains 'last week') ---")
@@ -843,9 +1439,7 @@ def test_nlp_vs_filter_comparison(account: str = "AdventHealth") -> None:
     
     # Method 2: Explicit filter (past_week keyword)
     print("\n--- Method 2: Explicit Filter (past_week) ---")
-    facet_filters = [
-        {"fieldName": "last_updated_at", "values": [{"relationType": "EQUALS", "value": "past_week"}]}
-    ]
+    facet_filters = _KEYWORD_FILTERS["past_week"]
     response_filter = glean_search_raw(
         query=f'"{account}" calls',
         datasources=["gong"],
@@ -859,21 +1453,135 @@ def test_nlp_vs_filter_comparison(account: str = "AdventHealth") -> None:
         doc = r.get("document", {})
         print(f"   [{i}] {doc.get('title', 'Untitled')} | Updated: {doc.get('updateTime', 'Unknown')}")
     
+    # Method 3: Explicit half-open range (last 7 days through today)
+    start_date, end_date = _date_window(7)
+    print(f"\n--- Method 3: Explicit Range ({start_date} < updated < {end_date}) ---")
+    response_range = glean_search_raw(
+        query=f'"{account}" calls',
+        datasources=["gong"],
+        num_results=5,
+        facet_filters=_date_range_filter(7),
+        debug=False
+    )
+    range_results = response_range.get("results", [])
+    print(f"Results: {len(range_results)}")
+    for i, r in enumerate(range_results[:3], 1):
+        doc = r.get("document", {})
+        print(f"   [{i}] {doc.get('title', 'Untitled')} | Updated: {doc.get('updateTime', 'Unknown')}")
+    
     # Summary
     print("\n--- Summary ---")
     print(f"NLP approach: {len(nlp_results)} results")
     print(f"Filter approach: {len(filter_results)} results")
+    print(f"Range approach: {len(range_results)} results")
     if len(filter_results) != len(nlp_results):
         print("⚠️  Different result counts - explicit filter may be more accurate")
     else:
         print("✅ Same result count")
 
 
-def run_all_tests():
-    """Run the standard test suite."""
-    print("="*60)
+class _ThreadStdout:
+    """
+    stdout proxy that lets worker threads write into their own buffers.
+    
+    Threads that have not started a capture write straight through.
+    """
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+    
+    def start_capture(self) -> io.StringIO:
+        """Send this thread's output to a fresh buffer until stop_capture()."""
+        self._local.buffer = io.StringIO()
+        return self._local.buffer
+    
+    def stop_capture(self) -> None:
+        self._local.buffer = None
+    
+    def write(self, text: str) -> int:
+        return (getattr(self._local, "buffer", None) or self._stream).write(text)
+    
+    def flush(self) -> None:
+        self._stream.flush()
+    
+    def __getattr__(self, name: str):
+        return getattr(self._stream, name)
+
+
+def _standard_tests() -> list[tuple]:
+    """(title, function, args) for each test in the standard suite, in order."""
+    return [
+        # Basic opportunity search
+        ("TEST: AdventHealth renewal opportunities",
+         test_salesforce_opportunities, ("AdventHealth renewal", "AdventHealth")),
+        # Check if other accounts leak in
+        ("TEST: JPMC opportunities (check for leaks)",
+         test_salesforce_opportunities, ("JPMorgan Chase renewal", "JPMorgan Chase")),
+        ("TEST: AdventHealth contacts",
+         test_salesforce_contacts, ("AdventHealth key contacts", "AdventHealth")),
+        ("TEST: AdventHealth recent calls",
+         test_communications, ("AdventHealth call", "AdventHealth")),
+        ("TEST: Discover available Salesforce facets",
+         discover_available_facets, ("salescloud",)),
+        ("TEST: Strict filtering experiments",
+         test_strict_opportunity_search, ("AdventHealth",)),
+        # JPMC quoted vs unquoted (uncomment to run)
+        # ("TEST: JPMC quoted vs unquoted", test_quoted_jpmc, ()),
+        # Post-filtering approach (uncomment to run)
+        # ("TEST: Post-filtering", test_with_post_filtering, ("JPMorgan Chase renewal", "JPMorgan Chase")),
+        # Inspect full response for permission fields
+        ("TEST: Inspect full Glean response structure",
+         inspect_full_response, ("AdventHealth renewal", "salescloud")),
+        ("TEST: Date Filter Keywords (past_day, past_week, etc.)",
+         test_date_filter_keywords, ()),
+        ("TEST: Date Range Filter (last 30 days)",
+         test_date_filter_range, ()),
+        ("TEST: NLP vs Explicit Date Filter Comparison",
+         test_nlp_vs_filter_comparison, ("AdventHealth",)),
+        ("TEST: Recent Communications (last 7 days)",
+         test_communications_time_filtered, ("AdventHealth", 7)),
+    ]
+
+
+def _run_test(title: str, func, args: tuple) -> None:
+    """Print a test's banner and run it."""
+    print_banner(title)
+    func(*args)
+
+
+def _warmup() -> None:
+    """
+    Open the pooled Glean connection before the tests start.
+    
+    One small search completes the TCP + TLS handshake up front, so the
+    first test is not charged for it and parallel workers share the warm
+    connection instead of each opening their own.
+    """
+    start = time.perf_counter()
+    try:
+        glean_search_raw(
+            query="AdventHealth",
+            datasources=["salescloud", "gong", "slack", "gmail", "gdrive"],
+            num_results=1
+        )
+    except Exception as e:
+        print(f"⚠️  Warm-up search failed: {e}")
+        return
+    print(f"🔥 Warm-up search done in {(time.perf_counter() - start) * 1000:.0f}ms")
+
+
+def run_all_tests(concurrency: int = 1):
+    """
+    Run the standard test suite.
+    
+    With `concurrency` > 1 the tests run on a thread pool (they are
+    independent and mostly wait on Glean). Each test's output is buffered
+    and printed in suite order once it finishes.
+    """
+    print(_BANNER)
     print("EPS Tool Lab - Test and Fine-tune Glean Tools")
-    print("="*60)
+    print(_BANNER)
     
     # Check credentials
     if not GLEAN_API_TOKEN:
@@ -882,82 +1590,96 @@ def run_all_tests():
     
     print(f"✅ Using Glean instance: {GLEAN_INSTANCE}")
     
-    # Example tests - uncomment what you want to test
-    
-    # Test 1: Basic opportunity search
-    print("\n" + "="*60)
-    print("TEST: AdventHealth renewal opportunities")
-    print("="*60)
-    test_salesforce_opportunities("AdventHealth renewal", "AdventHealth")
-    
-    # Test 2: Check if other accounts leak in
-    print("\n" + "="*60)
-    print("TEST: JPMC opportunities (check for leaks)")
-    print("="*60)
-    test_salesforce_opportunities("JPMorgan Chase renewal", "JPMorgan Chase")
-    
-    # Test 3: Contacts search
-    print("\n" + "="*60)
-    print("TEST: AdventHealth contacts")
-    print("="*60)
-    test_salesforce_contacts("AdventHealth key contacts", "AdventHealth")
-    
-    # Test 4: Communications
-    print("\n" + "="*60)
-    print("TEST: AdventHealth recent calls")
-    print("="*60)
-    test_communications("AdventHealth call", "AdventHealth")
-    
-    # Test 5: Discover facets
-    print("\n" + "="*60)
-    print("TEST: Discover available Salesforce facets")
-    print("="*60)
-    discover_available_facets("salescloud")
-    
-    # Test 6: Strict filtering experiments
-    print("\n" + "="*60)
-    print("TEST: Strict filtering experiments")
-    print("="*60)
-    test_strict_opportunity_search("AdventHealth")
-    
-    # Test 7: JPMC quoted vs unquoted (uncomment to run)
-    # test_quoted_jpmc()
-    
-    # Test 8: Post-filtering approach (uncomment to run)
-    # test_with_post_filtering("JPMorgan Chase renewal", "JPMorgan Chase")
-    
-    # Test 9: Inspect full response for permission fields
-    print("\n" + "="*60)
-    print("TEST: Inspect full Glean response structure")
-    print("="*60)
-    inspect_full_response("AdventHealth renewal", "salescloud")
-    
-    # Test 10: Date filter keywords
-    print("\n" + "="*60)
-    print("TEST: Date Filter Keywords (past_day, past_week, etc.)")
-    print("="*60)
-    test_date_filter_keywords()
-    
-    # Test 11: Date range filter
-    print("\n" + "="*60)
-    print("TEST: Date Range Filter (last 30 days)")
-    print("="*60)
-    test_date_filter_range()
-    
-    # Test 12: NLP vs explicit filter comparison
-    print("\n" + "="*60)
-    print("TEST: NLP vs Explicit Date Filter Comparison")
-    print("="*60)
-    test_nlp_vs_filter_comparison("AdventHealth")
-    
-    # Test 13: Recent communications with time filter
-    print("\n" + "="*60)
-    print("TEST: Recent Communications (last 7 days)")
-    print("="*60)
-    test_communications_time_filtered("AdventHealth", days_back=7)
-
-
-def test_gong_transcript_length(account: str = "AdventHealth"):
+    tests = _standard_tests()
+    
+    if concurrency <= 1:
+        for title, func, args in tests:
+            _run_test(title, func, args)
+        return
+    
+    stdout = _ThreadStdout(sys.stdout)
+    
+    def run_captured(test: tuple) -> str:
+        title, func, args = test
+        buffer = stdout.start_capture()
+        try:
+            _run_test(title, func, args)
+        except Exception as e:
+            print(f"❌ {title} failed: {e}")
+        finally:
+            stdout.stop_capture()
+        return buffer.getvalue()
+    
+    sys.stdout = stdout
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            # map() yields in submission order, so output stays in suite order
+            for output in executor.map(run_captured, tests):
+                stdout.write(output)
+                stdout.flush()
+    finally:
+        sys.stdout = stdout._stream
+
+
+def _dict_snippet_text(snippet: dict) -> str:
+    """Text of a snippet dict - Glean uses both {text} and {snippet: {text} | str}."""
+    text = snippet.get("text")
+    if text:
+        return text
+    
+    inner = snippet.get("snippet")
+    if isinstance(inner, dict):
+        return inner.get("text") or ""
+    if isinstance(inner, str):
+        return inner
+    return ""
+
+
+# Snippet text extractors by exact type; anything else is stringified
+_SNIPPET_TEXT = {dict: _dict_snippet_text, str: str}
+
+
+def get_snippet_text(snippet: Any) -> str:
+    """Text of one snippet, whatever shape Glean returned it in."""
+    return _SNIPPET_TEXT.get(type(snippet), str)(snippet)
+
+
+def _content_length(items: list) -> int:
+    """Total text length of a list of content items, as get_snippet_text reads them."""
+    if not items:
+        return 0
+    
+    # Plain text blocks (the usual llmContent shape) are measured directly
+    if isinstance(items[0], str) and all(isinstance(item, str) for item in items):
+        return sum(map(len, items))
+    
+    return sum(map(len, map(get_snippet_text, items)))
+
+
+# Content longer than this that ends on a sentence is treated as a full transcript
+_FULL_TRANSCRIPT_CHARS = 5000
+
+
+def _looks_complete_transcript(llm_content: Any) -> bool:
+    """True if llmContent is long and does not stop mid-sentence."""
+    if not llm_content:
+        return False
+    if isinstance(llm_content, list):
+        if _content_length(llm_content) <= _FULL_TRANSCRIPT_CHARS:
+            return False
+        text = get_snippet_text(llm_content[-1])
+    else:
+        text = str(llm_content)
+        if len(text) <= _FULL_TRANSCRIPT_CHARS:
+            return False
+    return text.rstrip().endswith((".", "!", "?", '"'))
+
+
+def test_gong_transcript_length(
+    account: str = "AdventHealth",
+    max_results_to_scan: int = 3,
+    stop_at_complete: bool = True
+):
     """
     Test to verify we're getting full Gong transcripts, not truncated versions.
     
@@ -965,31 +1687,33 @@ def test_gong_transcript_length(account: str = "AdventHealth"):
     1. What content fields are returned (llmContent vs snippets)
     2. The length of content returned
     3. Whether transcripts appear complete or cut off
+    
+    Scans up to `max_results_to_scan` results, stopping at the first one that
+    already looks like a full transcript unless `stop_at_complete` is False.
     """
-    print("\n" + "="*60)
-    print("GONG TRANSCRIPT LENGTH TEST")
-    print("="*60)
+    print_banner("GONG TRANSCRIPT LENGTH TEST")
     
-    # Search Gong specifically
-    response = glean_search_raw(
+    # Search Gong specifically - results are printed as pages arrive
+    results = iter_glean_search(
         query=f"{account} call",
         datasources=["gong"],
-        num_results=3,
-        debug=True
+        page_size=max_results_to_scan,
+        max_results=max_results_to_scan,
+        debug=True,
+        max_snippet_size=4000
     )
     
-    results = response.get("results", [])
-    print(f"\nFound {len(results)} Gong results\n")
-    
+    found = 0
     for i, r in enumerate(results, 1):
+        found = i
         doc = r.get("document", {})
         title = doc.get("title", "Untitled")
         url = doc.get("url", "")
         
-        print(f"\n{'='*60}")
+        print(f"\n{_BANNER}")
         print(f"RESULT {i}: {title}")
         print(f"URL: {url}")
-        print(f"{'='*60}")
+        print(f"{_BANNER}")
         
         # Check llmContent (preferred for LLM consumption)
         llm_content = r.get("llmContent")
@@ -1001,7 +1725,7 @@ def test_gong_transcript_length(account: str = "AdventHealth"):
                 print(f"   Preview: {llm_content[:500]}...")
                 print(f"   Last 200 chars: ...{llm_content[-200:]}")
             elif isinstance(llm_content, list):
-                total_len = sum(len(str(item)) for item in llm_content)
+                total_len = _content_length(llm_content)
                 print(f"   Items: {len(llm_content)}")
                 print(f"   Total length: {total_len} chars")
                 for j, item in enumerate(llm_content[:2]):
@@ -1017,20 +1741,7 @@ def test_gong_transcript_length(account: str = "AdventHealth"):
             
             # Debug: show raw structure of first snippet
             print(f"\n   Raw first snippet structure:")
-            print(f"   {json.dumps(snippets[0], indent=4, default=str)[:500]}")
-            
-            def get_snippet_text(s):
-                if isinstance(s, dict):
-                    # Try various paths Glean might use
-                    text = s.get("text") or s.get("snippet", {}).get("text") or ""
-                    if not text and "snippet" in s:
-                        snippet_obj = s["snippet"]
-                        if isinstance(snippet_obj, str):
-                            text = snippet_obj
-                        elif isinstance(snippet_obj, dict):
-                            text = snippet_obj.get("text", "")
-                    return text
-                return str(s)
+            print(f"   {_json_dumps_indented(snippets[0])[:500]}")
             
             # Show first 3 snippets
             total_snippet_len = 0
@@ -1041,20 +1752,24 @@ def test_gong_transcript_length(account: str = "AdventHealth"):
                     print(f"   Snippet {j+1} length: {len(text)} chars")
                     print(f"   Preview: {text[:300]}...")
             
-            # Calculate total for ALL snippets
-            all_text = "".join(get_snippet_text(s) for s in snippets)
-            print(f"\n   Total content length (all {len(snippets)} snippets): {len(all_text)} chars")
+            # Calculate total for ALL snippets (no need to join them)
+            total_len = sum(map(len, map(get_snippet_text, snippets)))
+            print(f"\n   Total content length (all {len(snippets)} snippets): {total_len} chars")
         else:
             print("\n⚠️  No snippets returned")
         
         # Check for any other content fields
         print(f"\n🔍 All top-level keys in result: {list(r.keys())}")
         print(f"🔍 All document keys: {list(doc.keys())}")
+        
+        if stop_at_complete and _looks_complete_transcript(r.get("llmContent")):
+            print("\n✅ This transcript looks complete - skipping the remaining results")
+            break
+    
+    print(f"\nScanned {found} Gong results")
     
     # Summary
-    print("\n" + "="*60)
-    print("SUMMARY")
-    print("="*60)
+    print_banner("SUMMARY")
     print("""
 Key things to check:
 1. Is llmContent present? (We set returnLlmContentOverSnippets=True)
@@ -1073,34 +1788,29 @@ def test_gong_full_content():
     """
     Test with maximum content settings to see if we can get more.
     """
-    print("\n" + "="*60)
-    print("GONG FULL CONTENT TEST (Max Settings)")
-    print("="*60)
+    print_banner("GONG FULL CONTENT TEST (Max Settings)")
     
     if not GLEAN_API_TOKEN or not GLEAN_INSTANCE:
         print("ERROR: GLEAN_API_TOKEN or GLEAN_INSTANCE not set")
         return
     
-    headers = {"Authorization": f"Bearer {GLEAN_API_TOKEN}"}
-    
     # Try with maximum snippet size
     payload = {
         "query": "AdventHealth call",
         "pageSize": 1,
         "maxSnippetSize": 50000,  # Try max
         "requestOptions": {
+            **_BASE_REQUEST_OPTIONS,
             "datasourcesFilter": ["gong"],
-            "returnLlmContentOverSnippets": True,
-            "facetBucketSize": 100,
+            "responseHints": list(RESULTS_ONLY),
         }
     }
     
     print(f"Requesting with maxSnippetSize=50000...")
     
-    with httpx.Client(timeout=30.0) as client:
-        response = client.post(get_glean_api_url(), headers=headers, json=payload)
-        response.raise_for_status()
-        data = response.json()
+    response = _get_http_client().post(get_glean_api_url(), content=_json_body(payload), headers=_JSON_HEADERS)
+    response.raise_for_status()
+    data = _json_loads(response.content)
     
     results = data.get("results", [])
     if not results:
@@ -1117,12 +1827,12 @@ def test_gong_full_content():
         if isinstance(llm_content, str):
             print(f"llmContent length: {len(llm_content)} chars")
         elif isinstance(llm_content, list):
-            total = sum(len(str(x)) for x in llm_content)
+            total = _content_length(llm_content)
             print(f"llmContent total length: {total} chars")
     
     snippets = r.get("snippets", [])
     if snippets:
-        total = sum(len(s.get("snippet", {}).get("text", "")) for s in snippets)
+        total = _content_length(snippets)
         print(f"Snippets total length: {total} chars")
     
     # Check if there's a way to get full content
@@ -1133,22 +1843,48 @@ def test_gong_full_content():
             print(f"  {key}: {len(val)} chars")
 
 
+_USAGE = "Usage: python tool_lab.py [gong|gong-full|strict [account] [--compare-variants]] [--concurrency N] [--warmup]"
+
+
 if __name__ == "__main__":
-    import sys
-    
     # Check credentials first
     if not GLEAN_API_TOKEN:
         print("❌ GLEAN_API_TOKEN not set. Add to .env file.")
         exit(1)
     
+    argv = sys.argv[1:]
+    
+    # --concurrency N runs the standard suite on N threads
+    concurrency = 1
+    if "--concurrency" in argv:
+        i = argv.index("--concurrency")
+        value = argv[i + 1] if i + 1 < len(argv) else "8"
+        if not value.isdigit() or int(value) < 1:
+            print(f"--concurrency needs a positive whole number, got: {value}")
+            print(_USAGE)
+            exit(2)
+        concurrency = int(value)
+        del argv[i:i + 2]
+    
+    # --warmup opens the Glean connection before any test runs
+    if "--warmup" in argv:
+        argv.remove("--warmup")
+        _warmup()
+    
     # Handle command-line arguments for specific tests
-    if len(sys.argv) > 1:
-        if sys.argv[1] == "gong":
-            test_gong_transcript_length(sys.argv[2] if len(sys.argv) > 2 else "AdventHealth")
-        elif sys.argv[1] == "gong-full":
+    if argv:
+        if argv[0] == "gong":
+            test_gong_transcript_length(argv[1] if len(argv) > 1 else "AdventHealth")
+        elif argv[0] == "gong-full":
             test_gong_full_content()
+        elif argv[0] == "strict":
+            args = [arg for arg in argv[1:] if arg != "--compare-variants"]
+            test_strict_opportunity_search(
+                args[0] if args else "AdventHealth",
+                compare_variants="--compare-variants" in argv
+            )
         else:
-            print(f"Unknown argument: {sys.argv[1]}")
-            print("Usage: python tool_lab.py [gong|gong-full]")
+            print(f"Unknown argument: {argv[0]}")
+            print(_USAGE)
     else:
-        run_all_tests()
+        run_all_tests(concurrency)